@@ -0,0 +1,284 @@
+"""
+Minimax solver for adversarial Wordle (see Absurdle_Game in wordle_game.py). The host always gives the worst result
+it can, so the only thing that matters about a guess is the worst case: the most guesses it could take to finish.
+
+Minimax_Solver searches the game tree with alpha-beta pruning. At each set of possible words it tries guesses, and for
+each guess it looks at the result buckets from biggest to smallest, giving up on the guess as soon as one bucket shows
+it can't beat the best guess found so far. Values are stored in a transposition table keyed on the set of possible words,
+since lots of different guess orders lead to the same set.
+"""
+
+import argparse
+import time
+from typing import List
+
+from wordle_game import Wordle_Game, Absurdle_Game
+from guess_pool import reduce_guess_pool
+from patterns import get_pattern_rows, guess_index
+from play_wordle import repeated_letters
+from definitions import GUESS_LIST, ANSWER_LIST, NUM_LETTERS, decode_result
+
+ALL_GREEN = tuple([2] * NUM_LETTERS)
+
+class SearchTimeout(Exception):
+    """Exception raised when Minimax_Solver runs out of time.
+
+    Attributes:
+        message -- explanation of the error
+    """
+
+    def __init__(self, message="Minimax search ran out of time"):
+        self.message = message
+        super().__init__(self.message)
+
+'''
+The fewest guesses it could possibly take to finish with num_words possible words, without looking at any of them.
+'''
+def lower_bound(num_words: int) -> int:
+    if num_words == 1:
+        return 1
+    # a guess has 3**NUM_LETTERS results, so with more words than that some result leaves at least 2
+    elif num_words <= 3**NUM_LETTERS:
+        return 2
+    else:
+        return 3
+
+class Minimax_Solver:
+    '''
+    guess_list: List[str]=GUESS_LIST - the guesses the solver is allowed to make (words with repeated letters are skipped,
+        since make_guess doesn't score them like the real game)
+    guess_width: int=10 - the number of guesses tried for each set of possible words (most promising first).
+        None tries all of them, which is exact but can be very slow. With a limit, every value found is still
+        a worst case the solver can actually guarantee; it just might not be the lowest possible.
+    time_limit: float=None - seconds allowed for each call to solve() or opener_bound(); None for no limit
+    '''
+    def __init__(self, guess_list: List[str]=GUESS_LIST, guess_width=10, time_limit=None):
+        self.guess_list = [word for word in guess_list if not repeated_letters(word)]
+        self.guess_width = guess_width
+        self.time_limit = time_limit
+
+        # keys are frozensets of possible words, values are [value, exact, guess]
+        # if exact is False, value is only a lower bound
+        self.table = {}
+
+        self.deadline = None
+        self.nodes = 0 # number of word sets searched
+
+    '''
+    Indices of candidates in the pattern rows' answer list (see patterns.py), or None if any of them isn't in it.
+    Worked out once for each set of possible words and passed to partition for every guess.
+    '''
+    def answer_indices(self, candidates: List[str]) -> List[int]:
+        answers = get_pattern_rows().answers
+        try:
+            return [answers.index(answer) for answer in candidates]
+        except ValueError:
+            return None
+
+    '''
+    Split candidates into buckets by the result of guessing guess. Results are read from the pattern rows
+    (see patterns.py) when guess is in them and indices (from answer_indices) are given.
+    return: dict - keys are results, values are lists of words
+    '''
+    def partition(self, guess: str, candidates: List[str], indices: List[int]=None) -> dict:
+        rows = get_pattern_rows()
+        if indices is None:
+            indices = self.answer_indices(candidates)
+        guess_idx = guess_index(rows, guess) if indices is not None else None
+        if guess_idx is not None:
+            row = rows.row(guess_idx)
+            codes = {}
+            for idx, answer in zip(indices, candidates):
+                codes.setdefault(row[idx], []).append(answer)
+
+            return {decode_result(code): bucket for code, bucket in codes.items()}
+
+        buckets = {}
+        for answer in candidates:
+            result = Wordle_Game(answer).make_guess(guess).info
+            buckets.setdefault(result, []).append(answer)
+
+        return buckets
+
+    '''
+    The guesses to try for candidates with their buckets, most promising (smallest worst case) first.
+    Guesses that don't split candidates at all are left out.
+    '''
+    def ordered_guesses(self, candidates: List[str], indices: List[int]=None) -> List:
+        pool, _ = reduce_guess_pool(candidates, self.guess_list)
+        candidate_set = set(candidates)
+        if indices is None:
+            indices = self.answer_indices(candidates)
+
+        guesses = []
+        for guess in pool:
+            buckets = self.partition(guess, candidates, indices)
+            largest = max(len(bucket) for bucket in buckets.values())
+            if largest == len(candidates):
+                continue
+            guesses.append((largest, -len(buckets), guess not in candidate_set, guess, buckets))
+
+        guesses.sort(key=lambda item: item[:3])
+        if self.guess_width:
+            guesses = guesses[:self.guess_width]
+
+        return [(guess, buckets) for _, _, _, guess, buckets in guesses]
+
+    '''
+    Find the fewest guesses needed to finish in the worst case when candidates are possible, but only if it's less than beta.
+
+    return: (int, str) - the number of guesses and the guess to make. If it can't be done in fewer than beta guesses,
+        the number returned is at least beta (and might not be exact) and the guess is None.
+    '''
+    def search(self, candidates: List[str], beta: int):
+        if len(candidates) == 1:
+            return 1, candidates[0]
+        # guess one of them; if it's wrong, the other one is the answer
+        if len(candidates) == 2:
+            return 2, candidates[0]
+
+        key = frozenset(candidates)
+        lower = lower_bound(len(candidates))
+        entry = self.table.get(key)
+        if entry:
+            value, exact, guess = entry
+            if exact or value >= beta:
+                return value, guess
+            lower = max(lower, value)
+
+        # can't possibly beat beta
+        if lower >= beta:
+            return lower, None
+
+        if self.deadline and time.time() > self.deadline:
+            raise SearchTimeout()
+        self.nodes += 1
+
+        best = beta
+        best_guess = None
+        for guess, buckets in self.ordered_guesses(candidates, self.answer_indices(candidates)):
+            # 1 guess if this is the answer; otherwise 1 plus whatever the bucket takes
+            worst = 1
+            for result, bucket in sorted(buckets.items(), key=lambda item: len(item[1]), reverse=True):
+                if result == ALL_GREEN:
+                    continue
+
+                value, _ = self.search(bucket, best - 1)
+                worst = max(worst, 1 + value)
+
+                # cutoff: the host can make this guess at least as bad as the best one so far
+                if worst >= best:
+                    break
+
+            if worst < best:
+                best = worst
+                best_guess = guess
+
+                # nothing can do better than this
+                if best <= lower:
+                    break
+
+        if best < beta:
+            self.table[key] = [best, True, best_guess]
+            return best, best_guess
+        else:
+            self.table[key] = [max(beta, lower), False, None]
+            return max(beta, lower), None
+
+    def _start_clock(self):
+        self.deadline = time.time() + self.time_limit if self.time_limit else None
+
+    '''
+    Find the best guess against an adversary when candidates are possible.
+    Raises SearchTimeout if time_limit runs out.
+
+    max_guesses: int=6 - don't look for anything that takes more guesses than this
+
+    return: (int, str) - worst case number of guesses and the guess to make, or (None, None) if it can't be done in max_guesses
+    '''
+    def solve(self, candidates: List[str], max_guesses=6):
+        self._start_clock()
+        value, guess = self.search(list(candidates), max_guesses + 1)
+        if guess is None:
+            return None, None
+
+        return value, guess
+
+    '''
+    Find how many guesses it takes to win with opener as the first guess when the adversary can pick any word in candidates.
+    Raises SearchTimeout if time_limit runs out.
+
+    return: int - worst case number of guesses (including the opener), or None if it can't be done in max_guesses
+    '''
+    def opener_bound(self, opener: str, candidates: List[str]=ANSWER_LIST, max_guesses=6) -> int:
+        self._start_clock()
+
+        worst = 1
+        buckets = self.partition(opener, list(candidates))
+        for result, bucket in sorted(buckets.items(), key=lambda item: len(item[1]), reverse=True):
+            if result == ALL_GREEN:
+                continue
+
+            value, _ = self.search(bucket, max_guesses)
+            if value >= max_guesses:
+                return None
+            worst = max(worst, 1 + value)
+
+        return worst
+
+'''
+Play an Absurdle_Game with a Minimax_Solver. Returns the number of guesses, or None if the solver couldn't find a way to
+win in max_guesses. If show_progress is marked as true, print progress along the way.
+'''
+def play_absurdle_simulated(game: Absurdle_Game, solver: Minimax_Solver, opener: str=None, max_guesses=6, show_progress=False) -> int:
+    guesses = 0
+    word = opener
+
+    while True:
+        if word is None:
+            _, word = solver.solve(game.word_list, max_guesses - guesses)
+            if word is None:
+                return None
+
+        guesses += 1
+        if game.correct_word(word):
+            break
+
+        guess_info = game.make_guess(word)
+        if show_progress:
+            print(f"Guessing {word}")
+            print(f"Result: {guess_info.info}")
+            print(f"Possible words remaining: {len(game.word_list)}\n")
+
+        word = None
+
+    if show_progress:
+        print(f"Solved! Solution: {word}")
+        print(f"Number of guesses: {guesses}")
+
+    return guesses
+
+def main():
+    parser = argparse.ArgumentParser(description="Find worst case bounds for first words against an adversarial host.")
+    parser.add_argument("openers", nargs="+", help="first words to check")
+    parser.add_argument("--max-guesses", type=int, default=6, help="give up on anything that takes more guesses than this")
+    parser.add_argument("--guess-width", type=int, default=10, help="guesses tried for each set of possible words (0 for all)")
+    parser.add_argument("--time-limit", type=float, help="seconds allowed for each first word")
+    args = parser.parse_args()
+
+    solver = Minimax_Solver(guess_width=args.guess_width or None, time_limit=args.time_limit)
+    for opener in args.openers:
+        start = time.time()
+        try:
+            bound = solver.opener_bound(opener, max_guesses=args.max_guesses)
+        except SearchTimeout:
+            print(f"{opener}: ran out of time")
+            continue
+
+        if bound is None:
+            print(f"{opener}: can't guarantee a win in {args.max_guesses} guesses")
+        else:
+            print(f"{opener}: wins in at most {bound} guesses ({time.time() - start:.1f}s, {solver.nodes} word sets searched)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Scores a whole pool of guesses at once instead of one word at a time (see score_words in strategies.py).
+Every guess's results against the possible words are counted straight from its pattern row (see patterns.py) into
+3**NUM_LETTERS counts, one per encoded result, and every strategy scores all the guesses from those counts.
+
+There are two backends that give exactly the same scores:
+- numpy: the rows for a chunk of guesses are stacked into one guesses x possible words array, and every guess's counts
+  come out of a single bincount (each guess's results are shifted into its own range of bins). Strategies are scored
+  with array operations over the whole chunk.
+- python: the same counts and scores worked out in pure Python. Used when NumPy isn't installed.
+
+Entropy terms come from the same table of p * log_2(1/p) values and are added up in result order either way,
+so even the floating point scores match.
+"""
+
+import math
+from typing import List
+from tqdm import tqdm
+
+# NumPy is optional; everything works without it, just slower
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from wordle_game import Wordle_Game
+from patterns import get_pattern_rows, guess_index, row_counts
+from strategies import get_strategy
+from definitions import NUM_LETTERS, encode_result, decode_result
+
+NUM_RESULTS = 3**NUM_LETTERS
+
+# every result, in encoded order
+RESULTS = [decode_result(code) for code in range(NUM_RESULTS)]
+
+BACKENDS = ["numpy", "python"]
+
+# most bytes of pattern rows to work on at once. A chunk's rows are all in memory together (and NumPy's temporary arrays
+# are up to 8 times as big), so this keeps it to a few tens of MB
+CHUNK_BYTES = 1 << 22
+
+'''
+Check a backend name. Returns "python" if "numpy" is asked for but NumPy isn't installed.
+'''
+def get_backend(backend: str) -> str:
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}. Choose from: {', '.join(BACKENDS)}")
+
+    if backend == "numpy" and np is None:
+        return "python"
+
+    return backend
+
+'''
+Pattern rows for words. Words that aren't in the pattern rows' guess list (or every word, if the rows were made for a
+different answer list than info's) get a row with results for the possible words in info only (nothing else in the row
+is ever looked at).
+'''
+def _pattern_rows(info, words: List[str]) -> list:
+    rows = info.pattern_rows()
+    pattern_rows = []
+    for word in words:
+        guess_idx = guess_index(rows, word)
+        if guess_idx is not None:
+            pattern_rows.append(rows.row(guess_idx))
+        else:
+            row = bytearray(len(info.answers))
+            for idx, answer in zip(info.candidate_indices(), info.word_list):
+                row[idx] = encode_result(Wordle_Game(answer).make_guess(word).info)
+            pattern_rows.append(row)
+
+    return pattern_rows
+
+'''
+Counts of each result for each pattern row, only counting the possible words at indices.
+return: array of shape (len(pattern_rows), NUM_RESULTS) with the count of each encoded result,
+    or for the python backend a list of dictionaries of encoded results and counts (only results that happen, in order)
+'''
+def result_counts(pattern_rows: list, indices: List[int], backend="numpy"):
+    if backend == "numpy":
+        matrix = np.frombuffer(b"".join(pattern_rows), dtype=np.uint8).reshape(len(pattern_rows), -1)
+        if len(indices) != matrix.shape[1]:
+            matrix = matrix[:, indices]
+
+        # shift row k's results into bins k*NUM_RESULTS to (k+1)*NUM_RESULTS - 1 so one bincount does every row
+        offsets = np.arange(len(pattern_rows), dtype=np.intp)[:, None] * NUM_RESULTS
+        counts = np.bincount((matrix + offsets).ravel(), minlength=len(pattern_rows) * NUM_RESULTS)
+        return counts.reshape(len(pattern_rows), NUM_RESULTS)
+
+    return [dict(sorted(row_counts(row, indices).items())) for row in pattern_rows]
+
+'''
+p * log_2(1/p) for p = count/total, for every count from 0 to total (0 for a count of 0).
+Same arithmetic as Entropy.score.
+'''
+def _entropy_terms(total: int) -> list:
+    terms = [0.0]
+    for count in range(1, total + 1):
+        p = count/total
+        terms.append(p * math.log2(1/p))
+
+    return terms
+
+def _entropy(counts, total):
+    terms = np.array(_entropy_terms(total))
+    scores = np.zeros(len(counts))
+    # one result at a time, in order, so the sums come out the same as in Python
+    for code in range(NUM_RESULTS):
+        scores += terms[counts[:, code]]
+
+    return scores
+
+# array versions of the strategies in strategies.py, keyed by strategy name
+# each takes a (guesses, NUM_RESULTS) array of counts and the number of possible words, and returns an array of scores
+ARRAY_SCORES = {
+    "entropy": _entropy,
+    "expected": lambda counts, total: (counts.astype(np.int64)**2).sum(axis=1)/total,
+    "minimax": lambda counts, total: counts.max(axis=1),
+    "buckets": lambda counts, total: (counts > 0).sum(axis=1),
+    "solve": lambda counts, total: (counts == 1).sum(axis=1)/total,
+}
+
+'''
+Score result counts (from result_counts) with a strategy.
+return: array of scores, or a list for the python backend
+'''
+def score_counts(counts, total: int, strategy, backend="numpy"):
+    strategy = get_strategy(strategy)
+    if backend == "numpy" and strategy.name in ARRAY_SCORES:
+        return ARRAY_SCORES[strategy.name](counts, total)
+
+    if backend == "numpy":
+        counts = [{code: row[code] for code in range(NUM_RESULTS) if row[code]} for row in counts.tolist()]
+
+    # buckets in result order, so entropy is added up the same way as in _entropy
+    scores = [strategy.score({RESULTS[code]: count for code, count in row.items()}, total) for row in counts]
+
+    return np.array(scores) if backend == "numpy" else scores
+
+'''
+Score every word in words by several strategies against one Wordle_Information object.
+
+return: dict - keys are strategy names, values are arrays of scores in the order of words (lists for the python backend)
+'''
+def score_pool(info, words: List[str], strategies, backend="numpy") -> dict:
+    backend = get_backend(backend)
+    strategies = [get_strategy(strategy) for strategy in strategies]
+
+    indices = info.candidate_indices()
+    counts = result_counts(_pattern_rows(info, words), indices, backend)
+    return {strategy.name: score_counts(counts, len(indices), strategy, backend) for strategy in strategies}
+
+'''
+Drop-in replacement for score_words (strategies.py) that scores words in batches with score_pool.
+Scores from multiple Wordle_Information objects are added up.
+
+infos: List[Wordle_Information] - the information to score against
+words: List[str] - the words to score
+strategies: List[Strategy or str] - the strategies to use
+backend: str="numpy" - "numpy" or "python" (falls back to "python" if NumPy isn't installed)
+show_progress: bool=True - whether or not to show a progress bar
+stop: threading.Event=None - if supplied and set partway through, scoring is abandoned and None is returned
+
+return: dict - keys are strategy names, values are lists of [word, score] in the order of words
+'''
+def score_words_batched(infos, words: List[str], strategies, backend="numpy", show_progress=True, stop=None) -> dict:
+    backend = get_backend(backend)
+    strategies = [get_strategy(strategy) for strategy in strategies]
+    scores = {strategy.name: [] for strategy in strategies}
+
+    # rows are whole rows (every answer, not just the possible ones), and shouldn't push the row cache past its budget
+    rows = get_pattern_rows()
+    chunk_bytes = min(CHUNK_BYTES, getattr(rows, 'max_bytes', CHUNK_BYTES))
+    chunk_size = max(1, chunk_bytes // max(1, len(rows.answers)))
+    with tqdm(total=len(words), disable=not show_progress) as progress:
+        for start in range(0, len(words), chunk_size):
+
+            # caller doesn't need the answer anymore
+            if stop and stop.is_set():
+                return None
+
+            chunk = words[start:start + chunk_size]
+            totals = {}
+            for info in infos:
+                for name, pool_scores in score_pool(info, chunk, strategies, backend).items():
+                    if backend == "numpy":
+                        pool_scores = pool_scores.tolist()
+                    totals[name] = pool_scores if name not in totals else [a + b for a, b in zip(totals[name], pool_scores)]
+
+            for strategy in strategies:
+                scores[strategy.name].extend([word, score] for word, score in zip(chunk, totals[strategy.name]))
+
+            progress.update(len(chunk))
+
+    return scores
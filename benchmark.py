@@ -0,0 +1,222 @@
+"""
+Benchmarks for the Wordle bot. Times the pieces that matter (checking words, adding and removing information,
+scoring guesses, whole simulated games), writes the results to a JSON file, and compares them to the stored
+baseline in benchmark_baseline.json. Exits with an error if anything got slower than the threshold allows.
+
+Everything random is seeded, so every run does exactly the same work. Timings on a busy machine can be off by a lot for
+a while, so if anything looks slower the benchmarks are run again (--retries times) and the best time for each is kept.
+--update-baseline always runs everything 1 + --retries times and stores the best time for each in the same way, so the
+baseline and the results it's compared to are worked out the same way.
+
+python benchmark.py                    run everything and compare to the baseline
+python benchmark.py --update-baseline  run everything and store the results as the new baseline
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from wordle_information import Wordle_Information, position_info
+from guess_info import Guess_Info
+from wordle_game import Wordle_Game
+from play_wordle import best_guess, play_wordle_simulated
+from batch_scoring import BACKENDS
+from definitions import ANSWER_LIST, result_configs
+
+SEED = 2022
+BASELINE_FILE = "benchmark_baseline.json"
+RESULTS_FILE = "benchmark_results.json"
+
+# answers and guesses used to set up positions partway through a game
+ANSWER = "pilot"
+GUESSES = ["crane"]
+
+'''
+Run func repeat times and return the fastest time in seconds.
+'''
+def time_best(func, repeat=5) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+'''
+Wordle_Information after playing GUESSES against ANSWER.
+'''
+def midgame_info() -> Wordle_Information:
+    return position_info(ANSWER, GUESSES)
+
+def bench_possible_word():
+    guess_info = Wordle_Game(ANSWER).make_guess(GUESSES[0])
+    return time_best(lambda: [guess_info.possible_word(word) for word in ANSWER_LIST])
+
+def bench_valid_word():
+    info = midgame_info()
+    return time_best(lambda: [info.valid_word(word) for word in ANSWER_LIST])
+
+def bench_add_remove_info():
+    info = midgame_info()
+    configs = random.Random(SEED).sample(result_configs(), 20)
+
+    def run():
+        for config in configs:
+            info.add_info(Guess_Info("doing", config), temporary=True)
+            info.remove_temporary_info()
+
+    return time_best(run)
+
+def bench_get_total_info():
+    info = midgame_info()
+    return time_best(lambda: info.get_total_info("doing"))
+
+def bench_best_guess(num_to_analyze, backend=None):
+    info = midgame_info()
+    return time_best(lambda: best_guess(info, num_to_analyze=num_to_analyze, show_progress=False, rng=random.Random(SEED),
+                                        backend=backend))
+
+'''
+Play num_games seeded games (the same ones every time). Returns the fastest total time and the average number of guesses.
+'''
+def bench_simulated_games(num_games, repeat=3):
+    guesses = []
+
+    def run():
+        rng = random.Random(SEED)
+        answers = rng.sample(ANSWER_LIST, num_games)
+        guesses[:] = [play_wordle_simulated(Wordle_Game(answer), rng=rng) for answer in answers]
+
+    elapsed = time_best(run, repeat)
+
+    # failed games count as 7 guesses
+    guesses = [num if num is not None else 7 for num in guesses]
+    return elapsed, sum(guesses)/len(guesses)
+
+'''
+Run every benchmark. Returns a dictionary of metric names and values (seconds unless the name says otherwise).
+Lower is better for every metric.
+'''
+def run_benchmarks(quick=False) -> dict:
+    metrics = {}
+
+    benchmarks = [
+        ("possible_word", bench_possible_word),
+        ("valid_word", bench_valid_word),
+        ("add_remove_info", bench_add_remove_info),
+        ("get_total_info", bench_get_total_info),
+    ]
+    for num in [50, 200] if quick else [50, 200, 1000]:
+        benchmarks.append((f"best_guess_{num}", lambda num=num: bench_best_guess(num)))
+    if not quick:
+        # scoring the whole pool at once (see batch_scoring.py)
+        for backend in BACKENDS:
+            benchmarks.append((f"best_guess_1000_{backend}", lambda backend=backend: bench_best_guess(1000, backend)))
+
+    for name, bench in benchmarks:
+        metrics[name] = bench()
+        print(f"{name}: {metrics[name]:.4f}s")
+
+    num_games = 3 if quick else 10
+    metrics[f"simulated_games_{num_games}"], metrics[f"simulated_games_{num_games}_mean_guesses"] = bench_simulated_games(num_games)
+    print(f"simulated_games_{num_games}: {metrics[f'simulated_games_{num_games}']:.4f}s "
+          f"(mean guesses {metrics[f'simulated_games_{num_games}_mean_guesses']:.2f})")
+
+    return metrics
+
+'''
+Combine the metrics from several runs of run_benchmarks, keeping the lowest value of each.
+Metrics missing from some runs are kept from the runs that have them.
+'''
+def best_of(runs: list) -> dict:
+    best = {}
+    for metrics in runs:
+        for name, value in metrics.items():
+            best[name] = min(value, best.get(name, value))
+
+    return best
+
+'''
+Compare metrics to baseline metrics. Returns a list of messages for metrics that are more than threshold
+(a fraction, so 0.25 is 25%) worse than the baseline. Metrics missing from either side are skipped.
+Differences smaller than min_delta are treated as noise.
+'''
+def find_regressions(metrics: dict, baseline: dict, threshold: float, min_delta=0.005) -> list:
+    regressions = []
+    for name, value in metrics.items():
+        if name not in baseline:
+            continue
+
+        limit = max(baseline[name] * (1 + threshold), baseline[name] + min_delta)
+        if value > limit:
+            regressions.append(f"{name}: {value:.4f} (baseline {baseline[name]:.4f}, limit {limit:.4f})")
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Wordle bot and compare to a stored baseline.")
+    parser.add_argument("--quick", action="store_true", help="skip the slowest benchmarks")
+    parser.add_argument("--output", default=RESULTS_FILE, help=f"where to write results (default {RESULTS_FILE})")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help=f"baseline to compare to (default {BASELINE_FILE})")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown as a fraction (default 0.25)")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--retries", type=int, default=2, help="times to run again before reporting a regression (default 2)")
+    args = parser.parse_args()
+
+    results = {
+        'seed': SEED,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'metrics': run_benchmarks(args.quick),
+    }
+
+    if args.update_baseline:
+        runs = [results['metrics']] + [run_benchmarks(args.quick) for _ in range(args.retries)]
+        results['metrics'] = best_of(runs)
+
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Stored baseline in {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['metrics']
+    except FileNotFoundError:
+        baseline = None
+
+    if baseline is not None:
+        regressions = find_regressions(results['metrics'], baseline, args.threshold)
+        for _ in range(args.retries):
+            if not regressions:
+                break
+
+            print("Running again in case that was noise")
+            results['metrics'] = best_of([results['metrics'], run_benchmarks(args.quick)])
+            regressions = find_regressions(results['metrics'], baseline, args.threshold)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to make one")
+        return
+
+    if regressions:
+        print("Regressions:")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+
+    print(f"No regressions (threshold {args.threshold:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+import pytest
+
+from wordle_information import position_info as make_position_info
+
+'''
+Wordle_Information partway through a game: position_info(answer, guesses) plays guesses against answer.
+'''
+@pytest.fixture
+def position_info():
+    return make_position_info
@@ -1,11 +1,27 @@
+import os
+
+from dictionary import load_dictionaries
+
 NUM_LETTERS = 5
 
-WORD_LIST = []
-# read words from words.txt
-with open("words.txt") as f:
-    for line in f.readlines():
-        WORD_LIST.append(line.strip())
-    f.close()
+# dictionary files to read allowed guesses from. Set WORDLE_DICTIONARIES to use others (separated like PATH)
+DICTIONARY_FILES = os.environ.get("WORDLE_DICTIONARIES", "words.txt").split(os.pathsep)
+
+# files to read possible answers from. Set WORDLE_ANSWERS to use others (separated like PATH)
+# if none of them exist, every allowed guess is a possible answer
+ANSWER_FILES = [path for path in os.environ.get("WORDLE_ANSWERS", "answers.txt").split(os.pathsep) if os.path.exists(path)]
+
+# read words from the dictionary files (see dictionary.py). Each list has its own index (GUESS_LIST.index(word) is fast).
+# answers are usually a lot fewer than guesses, so possible words are only ever looked for in ANSWER_LIST
+if ANSWER_FILES:
+    ANSWER_LIST = load_dictionaries(ANSWER_FILES, NUM_LETTERS)
+    GUESS_LIST = load_dictionaries(DICTIONARY_FILES + ANSWER_FILES, NUM_LETTERS) # answers can always be guessed
+else:
+    GUESS_LIST = load_dictionaries(DICTIONARY_FILES, NUM_LETTERS)
+    ANSWER_LIST = GUESS_LIST
+
+# every word the bot knows about
+WORD_LIST = GUESS_LIST
 
 '''
 Returns a list of possible configurations of green, yellow, and gray, represented by 2, 1, and 0.
@@ -20,4 +36,25 @@ def result_configs(configs = [[]], num_left=NUM_LETTERS):
             for config in configs:
                 new_configs.append(config + [i])
         
-        return result_configs(new_configs, num_left - 1)
\ No newline at end of file
+        return result_configs(new_configs, num_left - 1)
+
+'''
+Turn a result (list or tuple of 0, 1, and 2) into a single integer from 0 to 3**NUM_LETTERS - 1 so it can be used as an index.
+'''
+def encode_result(result) -> int:
+    code = 0
+    for n in result:
+        code = code*3 + n
+    
+    return code
+
+'''
+Reverse of encode_result. Returns a tuple.
+'''
+def decode_result(code: int, num_letters=NUM_LETTERS) -> tuple:
+    result = [0] * num_letters
+    for i in range(num_letters - 1, -1, -1):
+        result[i] = code % 3
+        code //= 3
+    
+    return tuple(result)
@@ -0,0 +1,141 @@
+"""
+Loads word lists. Dictionary files are read in chunks and every word is cleaned up, checked, and de-duplicated as it's
+read, then packed straight into a Packed_Words object. That way huge files (or lots of them) never end up in memory
+as a big list of strings: memory use depends on how many words are kept, not on how big the files are.
+"""
+
+import string
+from array import array
+from collections.abc import Sequence
+from typing import List
+
+'''
+A list of words of the same length packed end to end in one bytearray. Works like a read-only list of strings
+(indexing, slicing, len, in, iterating), but only takes up a few bytes per word plus a lookup table for finding them.
+
+The lookup table is a hash table stored in an array of word indices (open addressing with linear probing), so there's no
+Python object per word: with the table at most half full, it's 8 to 16 bytes per word on top of the word itself.
+'''
+class Packed_Words(Sequence):
+    def __init__(self, num_letters: int):
+        self.num_letters = num_letters
+        self.data = bytearray()
+        self.count = 0
+
+        # slots of the hash table; each is 0 (empty) or the index of a word plus 1. Always a power of 2 long
+        self.slots = array('I', bytes(4 * 16))
+
+    '''
+    The slot word (bytes) is in, or the empty slot it would go in.
+    '''
+    def _find(self, word: bytes) -> int:
+        mask = len(self.slots) - 1
+        slot = hash(word) & mask
+        n = self.num_letters
+        while True:
+            idx = self.slots[slot]
+            if idx == 0 or self.data[(idx - 1) * n:idx * n] == word:
+                return slot
+            slot = (slot + 1) & mask
+
+    '''
+    Double the hash table and put every word back in.
+    '''
+    def _grow(self):
+        self.slots = array('I', bytes(8 * len(self.slots)))
+        n = self.num_letters
+        for idx in range(self.count):
+            self.slots[self._find(bytes(self.data[idx * n:(idx + 1) * n]))] = idx + 1
+
+    '''
+    Add a packed word (bytes) to the end of the list. Returns False if it was already there.
+    '''
+    def add(self, word: bytes) -> bool:
+        slot = self._find(word)
+        if self.slots[slot]:
+            return False
+
+        self.data += word
+        self.count += 1
+        self.slots[slot] = self.count
+        if 2 * self.count > len(self.slots):
+            self._grow()
+
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("Packed_Words index out of range")
+
+        start = idx * self.num_letters
+        return self.data[start:start + self.num_letters].decode("ascii")
+
+    def __contains__(self, word) -> bool:
+        return (isinstance(word, str) and len(word) == self.num_letters and word.isascii()
+                and self.slots[self._find(word.encode("ascii"))] != 0)
+
+    '''
+    Index of word, like list.index. Only looks between start and stop if they're given.
+    '''
+    def index(self, word, start=0, stop=None) -> int:
+        idx = 0
+        if isinstance(word, str) and len(word) == self.num_letters and word.isascii():
+            idx = self.slots[self._find(word.encode("ascii"))]
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if not start < idx <= stop:
+            raise ValueError(f"{word} is not in word list")
+
+        return idx - 1
+
+    def __repr__(self) -> str:
+        return f"Packed_Words({len(self)} words of {self.num_letters} letters)"
+
+'''
+Stream words from one or more dictionary files into a Packed_Words object.
+
+Each line is stripped and lowercased. Lines that aren't exactly num_letters long or have characters outside of alphabet
+are skipped, and so are words already seen (in this file or an earlier one). Words are kept in the order they first appear.
+
+paths: List[str] - dictionary files, one word per line
+num_letters: int - length of words to keep
+alphabet: str=string.ascii_lowercase - allowed characters (after lowercasing)
+chunk_size: int=65536 - bytes to read at a time
+
+return: Packed_Words
+'''
+def load_dictionaries(paths: List[str], num_letters: int, alphabet=string.ascii_lowercase, chunk_size=1 << 16) -> Packed_Words:
+    words = Packed_Words(num_letters)
+    allowed = alphabet.encode("ascii")
+
+    def add_line(line: bytes):
+        word = line.strip().lower()
+        # translate deletes every allowed character, so anything left over isn't allowed
+        if len(word) == num_letters and not word.translate(None, allowed):
+            words.add(word)
+
+    for path in paths:
+        with open(path, "rb") as f:
+            # a chunk usually ends partway through a line; carry the end over to the next chunk
+            tail = b""
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+
+                lines = (tail + chunk).split(b"\n")
+                tail = lines.pop()
+                for line in lines:
+                    add_line(line)
+
+            add_line(tail)
+
+    return words
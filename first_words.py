@@ -1,7 +1,15 @@
 from wordle_information import Wordle_Information
-from play_wordle import best_guess
-from definitions import WORD_LIST
+from guess_info import Guess_Info
+from wordle_game import Wordle_Game
+from play_wordle import best_guess, repeated_letters, play_wordle_simulated
+from definitions import GUESS_LIST, ANSWER_LIST, NUM_LETTERS
+from opening_book import BOOK_FILE, load_opening_book, new_opening_book, save_opening_book, add_opener
+from tqdm import tqdm
+from multiprocessing import Pool
+import argparse
+import copy
 import json
+import random
 
 '''
 Searches for the best first words in word_list picking up where it left off.
@@ -13,7 +21,7 @@ step: number of words to analyze in one batch before re-writing to file
 
 Only analyzes words that don't repeat letters.
 '''
-def search_for_first_words(step=10, word_list=WORD_LIST):
+def search_for_first_words(step=10, word_list=GUESS_LIST):
     # used to analyze words
     info = Wordle_Information()
 
@@ -86,8 +94,159 @@ def get_best_first_words(num = 5) -> dict:
     
     return words
 
+'''
+Build the opening book (see opening_book.py) for the top num_openers first words from first_words.json.
+For every result each first word can give, the best second guess is found with best_guess and stored.
+Openers already in the book are skipped, and the book is written after each opener so this can be stopped and restarted.
+
+num_to_analyze: number of guesses to analyze for each result. Defaults to every word without repeated letters.
+strategy: how to score second guesses (see strategies.py)
+'''
+def build_opening_book(num_openers=5, num_to_analyze=None, strategy='entropy', word_list=GUESS_LIST, book_file=BOOK_FILE):
+    book = load_opening_book(book_file, word_list, strategy) or new_opening_book(word_list, strategy)
+
+    # only analyze words that can be guessed in play_wordle
+    guesses = [word for word in word_list if not repeated_letters(word)]
+    if num_to_analyze is None:
+        num_to_analyze = len(guesses)
+
+    for opener, _ in get_best_first_words(num_openers):
+        if opener in book['openers']:
+            print(f"{opener} is already in the opening book")
+            continue
+
+        print(f"Building opening book for {opener}")
+        info = Wordle_Information()
+        second_guesses = {}
+
+        for result in tqdm(info.get_result_buckets(opener)):
+            # game is already over
+            if result == tuple([2] * NUM_LETTERS):
+                continue
+
+            after = copy.deepcopy(info)
+            after.add_info(Guess_Info(opener, result))
+
+            # no need to analyze if there's only one word (or none) left
+            if len(after.word_list) <= 1:
+                if after.word_list:
+                    second_guesses[result] = after.word_list[0]
+                continue
+
+            second_guesses[result] = best_guess(after, word_list=guesses, num_to_analyze=num_to_analyze, shuffle_words=False,
+                                                show_progress=False, strategy=strategy)[0]
+
+        add_opener(book, opener, second_guesses, word_list)
+        save_opening_book(book, book_file)
+
+# number of guesses a game the bot couldn't solve counts as in the tournament
+FAILED_GUESSES = 7
+
+'''
+Helper function to run_tournament. Plays one game and returns (opener, answer, guesses).
+Every game gets its own seed, so results don't depend on which process plays it or in what order.
+The opening book isn't used, since it only covers some of the openers and would give them an unfair advantage.
+'''
+def _play_tournament_game(task):
+    opener, answer, strategy, seed = task
+    guesses = play_wordle_simulated(Wordle_Game(answer), strategy=strategy, opener=opener, use_book=False,
+                                    rng=random.Random(f"{seed}:{opener}:{answer}"))
+    return opener, answer, guesses
+
+'''
+Summarize a list of guess counts (None for games that weren't solved).
+'''
+def _tournament_stats(results: list, complete: bool) -> dict:
+    guesses = [num if num is not None else FAILED_GUESSES for num in results]
+    return {
+        'games': len(guesses),
+        'mean': sum(guesses)/len(guesses),
+        'worst': max(guesses),
+        'failed': results.count(None),
+        'complete': complete,
+    }
+
+'''
+Rank the top num_openers first words from first_words.json by actually playing games with them against every answer.
+
+Uses successive halving so it doesn't take forever: every opener still in the running plays the same sample of answers,
+then the worse half (by mean guesses) is dropped and the sample doubles for the next round. Once only one opener is
+left, it plays the rest of the answers. Games are played in parallel in a process pool.
+
+Results are stored in first_words.json under 'tournament' (keys are openers, values have the number of games played,
+mean guesses, worst case guesses, number of games the bot couldn't solve, and whether it played every answer).
+They're written after every round so progress isn't lost.
+
+first_round: int=50 - number of answers in the first round
+processes: int=None - number of processes to use (defaults to one per CPU)
+seed: int=0 - seed for the order of answers and for every game
+'''
+def run_tournament(num_openers=8, first_round=50, processes=None, strategy='entropy', seed=0, answer_list=ANSWER_LIST) -> dict:
+    openers = [word for word, _ in get_best_first_words(num_openers)]
+    answers = list(answer_list)
+    random.Random(seed).shuffle(answers)
+
+    results = {opener: [] for opener in openers}
+    remaining = openers
+    played = 0
+    round_size = first_round
+
+    with Pool(processes) as pool:
+        while remaining and played < len(answers):
+            # last one standing plays everything that's left
+            if len(remaining) == 1:
+                round_size = len(answers) - played
+            sample = answers[played:played + round_size]
+            print(f"Playing {len(sample)} answers with {len(remaining)} openers: {', '.join(remaining)}")
+
+            tasks = [(opener, answer, strategy, seed) for opener in remaining for answer in sample]
+            for opener, _, guesses in tqdm(pool.imap_unordered(_play_tournament_game, tasks, chunksize=4), total=len(tasks)):
+                results[opener].append(guesses)
+            played += len(sample)
+
+            # store progress
+            stats = {opener: _tournament_stats(results[opener], len(results[opener]) == len(answers)) for opener in openers}
+            with open("first_words.json", 'r') as f:
+                first_words = json.load(f)
+            first_words['tournament'] = stats
+            with open("first_words.json", 'w') as f:
+                json.dump(first_words, f)
+
+            # drop the worse half and look at the rest more closely
+            remaining = sorted(remaining, key=lambda opener: stats[opener]['mean'])[:(len(remaining) + 1)//2]
+            round_size *= 2
+
+    print_tournament_results()
+    return stats
+
+'''
+Print tournament results from first_words.json, best mean first.
+'''
+def print_tournament_results():
+    with open("first_words.json", 'r') as f:
+        stats = json.load(f).get('tournament', {})
+
+    # openers that made it further played more games, so they go first
+    ranked = sorted(stats.items(), key=lambda item: (-item[1]['games'], item[1]['mean']))
+    for idx, (opener, data) in enumerate(ranked):
+        print(f"{idx + 1}: {opener} (mean {data['mean']:.3f}, worst {data['worst']}, "
+              f"{data['games']} games, {data['failed']} failed)")
+
 def main():
-    search_for_first_words()
+    parser = argparse.ArgumentParser(description="Analyze first words.")
+    parser.add_argument("--opening-book", type=int, metavar="N", help="build the opening book for the top N first words instead")
+    parser.add_argument("--num-to-analyze", type=int, help="number of second guesses to analyze per result (opening book only)")
+    parser.add_argument("--tournament", type=int, metavar="N", help="rank the top N first words by playing games with them instead")
+    parser.add_argument("--first-round", type=int, default=50, help="answers played in the first tournament round")
+    parser.add_argument("--processes", type=int, help="processes to play tournament games in (default one per CPU)")
+    args = parser.parse_args()
+
+    if args.opening_book:
+        build_opening_book(args.opening_book, num_to_analyze=args.num_to_analyze)
+    elif args.tournament:
+        run_tournament(args.tournament, first_round=args.first_round, processes=args.processes)
+    else:
+        search_for_first_words()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
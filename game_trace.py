@@ -0,0 +1,179 @@
+"""
+Records games so slow turns can be reproduced later, and replays recorded games against the current code.
+
+play_wordle and play_wordle_simulated append one JSON line per game to a trace file when given one. Each line has:
+- mode: "interactive" or "simulated"
+- strategy: the strategy used to score guesses
+- backend: the backend given to best_guess (null to score words one at a time; see batch_scoring.py)
+- num_guesses, num_answers: lengths of GUESS_LIST and ANSWER_LIST when it was recorded
+- answer: the answer, if it's known
+- solved: whether the game was won
+- turns: one list per guess, in the order of TURN_FIELDS:
+    guess       the word guessed
+    result      the result, encoded with encode_result()
+    candidates  number of possible words before the guess
+    seconds     time spent working out suggestions for this turn
+    analyzed    num_to_analyze given to best_guess (0 if it wasn't called)
+    source      where the guess came from: "opener", "book", "live" (best_guess), "speculated" (see speculation.py),
+                "only" (the only possible word left), or "user" (interactive games where no words were analyzed)
+    seed        seed for the random.Random given to best_guess (or the Speculator, for speculated turns), so the same
+                words are analyzed again on replay
+  If an interactive game was interrupted while suggestions were being worked out, its last turn has no guess or result
+  (both null) and seconds is how long it had taken until then.
+
+python game_trace.py traces.jsonl   replay every game in traces.jsonl and compare times
+"""
+
+import argparse
+import json
+import random
+import time
+from multiprocessing import Pool
+
+from wordle_information import Wordle_Information
+from guess_info import Guess_Info
+from patterns import get_pattern_rows
+from definitions import GUESS_LIST, ANSWER_LIST, encode_result, decode_result
+
+TURN_FIELDS = ["guess", "result", "candidates", "seconds", "analyzed", "source", "seed"]
+
+class Game_Trace:
+    def __init__(self, mode: str, strategy='entropy', backend: str=None):
+        self.mode = mode
+        self.strategy = str(strategy)
+        self.backend = backend
+        self.turns = []
+
+    def add_turn(self, guess: str, result, candidates: int, seconds=0.0, analyzed=0, source="live", seed=None):
+        code = encode_result(result) if result is not None else None
+        self.turns.append([guess, code, candidates, round(seconds, 5), analyzed, source, seed])
+
+    '''
+    Append the game to trace_file as one line of JSON.
+    '''
+    def save(self, trace_file: str, answer: str=None, solved=False):
+        line = json.dumps({
+            'mode': self.mode,
+            'strategy': self.strategy,
+            'backend': self.backend,
+            'num_guesses': len(GUESS_LIST),
+            'num_answers': len(ANSWER_LIST),
+            'answer': answer,
+            'solved': solved,
+            'turns': self.turns,
+        }, separators=(',', ':'))
+
+        # one write per game so games from different processes don't get mixed together
+        with open(trace_file, 'a') as f:
+            f.write(line + "\n")
+
+'''
+Read every game from trace_file.
+'''
+def load_traces(trace_file: str) -> list:
+    traces = []
+    with open(trace_file, 'r') as f:
+        for line in f:
+            if line.strip():
+                traces.append(json.loads(line))
+
+    return traces
+
+'''
+Replay one recorded game without any input or output. Every turn where best_guess was called is timed again with the
+same settings (including the backend) and seed, then the recorded guess and result are added like in the original game.
+
+return: list - one dictionary per replayed turn with turn (1-based), guess, source, candidates, recorded and replayed
+    (seconds), and matches (whether the number of possible words is the same as when it was recorded)
+'''
+def replay_trace(trace: dict) -> list:
+    # imported here since play_wordle imports this module
+    from play_wordle import best_guess
+
+    info = Wordle_Information()
+    turns = []
+    for idx, turn in enumerate(trace['turns']):
+        turn = dict(zip(TURN_FIELDS, turn))
+
+        if turn['analyzed'] > 0 and turn['source'] in ("live", "speculated"):
+            start = time.perf_counter()
+            best_guess(info, num_choices=5 if trace['mode'] == "interactive" else 1, num_to_analyze=turn['analyzed'],
+                       show_progress=False, strategy=trace['strategy'], rng=random.Random(turn['seed']),
+                       backend=trace.get('backend'))
+            replayed = time.perf_counter() - start
+
+            turns.append({
+                'turn': idx + 1,
+                'guess': turn['guess'] or "-",
+                'source': turn['source'],
+                'candidates': turn['candidates'],
+                'recorded': turn['seconds'],
+                'replayed': replayed,
+                'matches': len(info.word_list) == turn['candidates'],
+            })
+
+        # interrupted before the guess was made
+        if turn['guess'] is None:
+            break
+
+        info.add_info(Guess_Info(turn['guess'], decode_result(turn['result'])))
+
+    return turns
+
+'''
+Set up each replay process before timing anything, so the first turn it replays doesn't include making the pattern rows.
+'''
+def _warm_up():
+    get_pattern_rows()
+
+'''
+Replay every game in trace_file in parallel and print how long each turn took compared to when it was recorded.
+Turns that came from the speculator are listed but left out of the totals, since the recorded time is just however
+long the user had to wait for it.
+
+return: list - one list of turns (see replay_trace) per game
+'''
+def replay_traces(trace_file: str, processes=None) -> list:
+    traces = load_traces(trace_file)
+    for trace in traces:
+        if trace['num_guesses'] != len(GUESS_LIST) or trace['num_answers'] != len(ANSWER_LIST):
+            print("Warning: some games were recorded with different word lists; possible words won't match")
+            break
+
+    with Pool(processes, initializer=_warm_up) as pool:
+        results = pool.map(replay_trace, traces)
+
+    recorded_total = 0
+    replayed_total = 0
+    print(f"{'game':>5} {'turn':>4} {'guess':>6} {'words':>6} {'recorded':>9} {'replayed':>9} {'change':>8}")
+    for game, turns in enumerate(results):
+        for turn in turns:
+            change = (turn['replayed'] - turn['recorded'])/turn['recorded'] if turn['recorded'] else 0
+            note = ""
+            if turn['source'] == "speculated":
+                note = " (speculated)"
+            elif not turn['matches']:
+                note = " (possible words don't match)"
+            print(f"{game + 1:>5} {turn['turn']:>4} {turn['guess']:>6} {turn['candidates']:>6} "
+                  f"{turn['recorded']:>8.3f}s {turn['replayed']:>8.3f}s {change:>+8.0%}{note}")
+
+            if turn['source'] != "speculated":
+                recorded_total += turn['recorded']
+                replayed_total += turn['replayed']
+
+    if recorded_total:
+        print(f"Total: {recorded_total:.3f}s recorded, {replayed_total:.3f}s replayed "
+              f"({(replayed_total - recorded_total)/recorded_total:+.0%})")
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded games and compare how long each turn takes now.")
+    parser.add_argument("trace_file", help="JSON lines file written by play_wordle or play_wordle_simulated")
+    parser.add_argument("--processes", type=int, help="processes to replay games in (default one per CPU)")
+    args = parser.parse_args()
+
+    replay_traces(args.trace_file, args.processes)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Shrinks the pool of guesses worth scoring on a turn. Partway through a game, lots of guesses split the possible words
+up in exactly the same way, so best_guess would score the same buckets over and over.
+
+The result at each position of a guess only depends on the letter there (see Wordle_Game.make_guess). If that letter
+gives the same result for every possible word (it's in none of them, it's green in all of them, or it's in all of them
+but never at that spot), the position tells us nothing. Guesses that match at every informative position split the
+possible words the same way, so only one of them needs to be scored.
+
+On top of that, if one guess's informative positions are a subset of another's (with the same letters), the other guess
+splits the possible words up at least as finely, so the first can't score better with any of the strategies in strategies.py.
+The exception is a guess that could be the answer: it's only dropped for another guess that could be the answer too,
+so the bot can always still guess a word that wins outright.
+
+Like select_words in play_wordle.py, guesses with repeated letters are never kept (make_guess gets them wrong).
+"""
+
+from itertools import combinations
+from typing import List
+
+from definitions import NUM_LETTERS
+
+'''
+Reduce words to one guess per class of guesses that split candidates the same way, dropping classes beaten by another.
+Guesses that could be the answer are preferred as the representative of their class. Guesses with repeated letters are skipped.
+
+candidates: List[str] - the words that are still possible
+words: List[str] - the guesses to reduce
+
+return: (List[str], dict) - the guesses worth scoring (in their original order) and a summary of how much the pool shrank:
+    words (size of the original pool), classes (number of distinct splits), dominated (classes dropped), kept
+'''
+def reduce_guess_pool(candidates: List[str], words: List[str]):
+    num_candidates = len(candidates)
+
+    # how many candidates contain each letter, and how many have it at each position
+    contains = {}
+    at_position = {}
+    for word in candidates:
+        for letter in set(word):
+            contains[letter] = contains.get(letter, 0) + 1
+        for i in range(NUM_LETTERS):
+            at_position[(i, word[i])] = at_position.get((i, word[i]), 0) + 1
+
+    def informative(i, letter):
+        num_contain = contains.get(letter, 0)
+        num_at = at_position.get((i, letter), 0)
+
+        # always gray, always green, or always yellow
+        return not (num_contain == 0 or num_at == num_candidates or (num_contain == num_candidates and num_at == 0))
+
+    # group guesses by the letters at their informative positions (None everywhere else)
+    candidate_set = set(candidates)
+    classes = {}
+    for word in words:
+        if len(set(word)) != len(word):
+            continue
+
+        signature = tuple(word[i] if informative(i, word[i]) else None for i in range(NUM_LETTERS))
+        if signature not in classes or (word in candidate_set and classes[signature] not in candidate_set):
+            classes[signature] = word
+
+    # a class is dominated if its informative positions are a proper subset of another class's
+    # (classes that could be the answer only lose to classes that could be the answer too)
+    dominated = set()
+    for signature in classes:
+        positions = [i for i in range(NUM_LETTERS) if signature[i] is not None]
+        for size in range(len(positions)):
+            for subset in combinations(positions, size):
+                smaller = tuple(signature[i] if i in subset else None for i in range(NUM_LETTERS))
+                if smaller in classes and (classes[smaller] not in candidate_set or classes[signature] in candidate_set):
+                    dominated.add(smaller)
+
+    kept = [word for signature, word in classes.items() if signature not in dominated]
+
+    return kept, {'words': len(words), 'classes': len(classes), 'dominated': len(dominated), 'kept': len(kept)}
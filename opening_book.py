@@ -0,0 +1,112 @@
+"""
+The opening book stores the best second guess for every result of the top first words, so the second turn
+(which has the most possible words left and is the most expensive to analyze) is just a lookup.
+
+It lives in opening_book.json and is built by build_opening_book() in first_words.py:
+- words_hash: word_list_hash() of the guess list it was built with
+- answers_hash: word_list_hash() of the answer list it was built with (the book is ignored if either list changes)
+- strategy: the strategy used to pick the second guesses (the book is only used with the same strategy)
+- openers: dictionary where keys are first words and values are lists of 3**NUM_LETTERS word list indices.
+  The entry at encode_result(result) is the index (in the guess list) of the best second guess after that result,
+  or -1 if there isn't one.
+"""
+
+import hashlib
+import json
+import os
+from typing import List
+
+from definitions import GUESS_LIST, ANSWER_LIST, NUM_LETTERS, encode_result
+
+BOOK_FILE = "opening_book.json"
+
+# loaded books, keyed by file name
+_books = {}
+
+# hashes of word lists, keyed by id (hashing a big list takes a while)
+_hashes = {}
+
+'''
+Hash of the words in word_list, in order, so a book is never used with a different list that happens to be the same length.
+'''
+def word_list_hash(word_list: List[str]) -> str:
+    if id(word_list) not in _hashes:
+        _hashes[id(word_list)] = (word_list, hashlib.sha256("\n".join(word_list).encode("ascii")).hexdigest()[:16])
+
+    return _hashes[id(word_list)][1]
+
+'''
+Make a new empty opening book for word_list.
+'''
+def new_opening_book(word_list: List[str]=GUESS_LIST, strategy='entropy') -> dict:
+    return {'words_hash': word_list_hash(word_list), 'answers_hash': word_list_hash(ANSWER_LIST), 'strategy': str(strategy),
+            'openers': {}}
+
+'''
+Read the opening book from book_file. Returns None if there isn't one, it was built for a different word list,
+or it was built with a different strategy. Books are only read from disk once.
+'''
+def load_opening_book(book_file=BOOK_FILE, word_list: List[str]=GUESS_LIST, strategy='entropy') -> dict:
+    if book_file not in _books:
+        book = None
+        if os.path.exists(book_file):
+            with open(book_file, 'r') as f:
+                book = json.load(f)
+        _books[book_file] = book
+
+    book = _books[book_file]
+    if (book is None or book.get('words_hash') != word_list_hash(word_list) or book.get('answers_hash') != word_list_hash(ANSWER_LIST)
+            or book['strategy'] != str(strategy)):
+        return None
+
+    return book
+
+'''
+Write the opening book to book_file.
+'''
+def save_opening_book(book: dict, book_file=BOOK_FILE):
+    with open(book_file, 'w') as f:
+        json.dump(book, f, separators=(',', ':'))
+
+    _books[book_file] = book
+
+'''
+Add the second guesses for one first word to the book.
+second_guesses: dict - keys are results (tuples), values are the best second guess after that result
+'''
+def add_opener(book: dict, opener: str, second_guesses: dict, word_list: List[str]=GUESS_LIST):
+    index = {word: idx for idx, word in enumerate(word_list)}
+
+    entries = [-1] * 3**NUM_LETTERS
+    for result, guess in second_guesses.items():
+        entries[encode_result(result)] = index[guess]
+
+    book['openers'][opener] = entries
+
+'''
+Look up the best second guess by strategy after guessing opener and getting result. Returns None if it's not in the book.
+'''
+def book_guess(opener: str, result, book_file=BOOK_FILE, word_list: List[str]=GUESS_LIST, strategy='entropy') -> str:
+    book = load_opening_book(book_file, word_list, strategy)
+    if book is None or opener not in book['openers']:
+        return None
+
+    idx = book['openers'][opener][encode_result(result)]
+    if idx < 0:
+        return None
+
+    return word_list[idx]
+
+'''
+Check if opener has an entry in the book.
+'''
+def in_book(opener: str, book_file=BOOK_FILE, word_list: List[str]=GUESS_LIST, strategy='entropy') -> bool:
+    book = load_opening_book(book_file, word_list, strategy)
+    return book is not None and opener in book['openers']
+
+'''
+First words that have entries in the book, in the order they were added. Empty if there's no usable book.
+'''
+def book_openers(book_file=BOOK_FILE, word_list: List[str]=GUESS_LIST, strategy='entropy') -> List[str]:
+    book = load_opening_book(book_file, word_list, strategy)
+    return list(book['openers']) if book is not None else []
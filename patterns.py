@@ -0,0 +1,237 @@
+"""
+Results of every guess against every possible answer, so scoring a guess doesn't have to play it out against every
+possible word again. A guess's row has one byte per answer in ANSWER_LIST: the result encoded with encode_result().
+The full table is len(GUESS_LIST) * len(ANSWER_LIST) bytes.
+
+Rows are worked out with a trick to keep it fast without any outside libraries. The result at each position of a guess
+only depends on the letter there (see Wordle_Game.make_guess), so for every position and letter there's a row of that
+position's share of the encoded result for every answer. Those rows are stored as big integers with one byte per answer.
+A guess's full row is just the sum of the five rows for its letters, since no byte can get bigger than 242 and carry.
+
+When the full table would be too big (WORDLE_PATTERN_BYTES, 256 MB by default), a Pattern_Row_Cache is used instead.
+It works rows out the first time they're needed and only keeps as many as fit in the budget. Either way, anything
+using the rows just calls row(guess_idx).
+"""
+
+import atexit
+import dbm
+import glob
+import os
+import shutil
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from typing import List
+
+from definitions import GUESS_LIST, ANSWER_LIST, NUM_LETTERS
+
+# most memory the pattern rows should take up, in bytes
+PATTERN_BYTES = int(os.environ.get("WORDLE_PATTERN_BYTES", 256 * 2**20))
+
+# directory to write rows to when they don't fit in PATTERN_BYTES (None to just work them out again)
+PATTERN_SPILL_DIR = os.environ.get("WORDLE_PATTERN_SPILL")
+
+class Row_Builder:
+    def __init__(self, answers: List[str]=ANSWER_LIST):
+        self.answers = answers
+
+        # keys are (position, letter), values are big integers with that position's share of the result for every answer
+        self.shares = {}
+
+    def share(self, i: int, letter: str) -> int:
+        if (i, letter) not in self.shares:
+            place = 3**(NUM_LETTERS - 1 - i)
+            shares = bytes(2*place if answer[i] == letter else place if letter in answer else 0 for answer in self.answers)
+            self.shares[(i, letter)] = int.from_bytes(shares, "little")
+
+        return self.shares[(i, letter)]
+
+    '''
+    Results of guessing guess against every answer (byte k is the encoded result if answers[k] is the answer).
+    '''
+    def row(self, guess: str) -> bytes:
+        total = 0
+        for i in range(NUM_LETTERS):
+            total += self.share(i, guess[i])
+
+        return total.to_bytes(len(self.answers), "little")
+
+'''
+The rows for every guess, all worked out up front.
+'''
+class Pattern_Table:
+    def __init__(self, guesses: List[str]=GUESS_LIST, answers: List[str]=ANSWER_LIST):
+        self.guesses = guesses
+        self.answers = answers
+
+        builder = Row_Builder(answers)
+        self.rows = [builder.row(guess) for guess in guesses]
+
+    '''
+    Results of the guess at guess_idx in guesses against every answer.
+    '''
+    def row(self, guess_idx: int) -> bytes:
+        return self.rows[guess_idx]
+
+'''
+Rows worked out only when they're asked for. The most recently used rows are kept in memory up to max_bytes
+(not counting the per-letter rows in Row_Builder, which take up 26 * NUM_LETTERS rows at most).
+
+If spill_dir is given, rows pushed out of memory are written to a dbm database in it and read back from there
+instead of being worked out again. Each process gets its own temporary directory for its database, so this is safe to
+use with multiprocessing. The directory is deleted by close(), which is called when the process exits (or use the cache
+in a with statement). On POSIX systems, directories left behind by processes that exit without cleaning up (like
+multiprocessing workers) are deleted the next time one is made.
+'''
+class Pattern_Row_Cache:
+    def __init__(self, guesses: List[str]=GUESS_LIST, answers: List[str]=ANSWER_LIST, max_bytes=PATTERN_BYTES, spill_dir=None):
+        self.guesses = guesses
+        self.answers = answers
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+
+        self.builder = Row_Builder(answers)
+
+        # keys are guess indices, values are rows; least recently used first
+        self.rows = OrderedDict()
+        self.size = 0
+
+        # dbm database rows are spilled to, the directory it's in, and the process it was opened in
+        self.spill = None
+        self.spill_path = None
+        self.spill_pid = None
+
+        # rows are asked for from background threads too (see speculation.py)
+        self.lock = threading.Lock()
+
+        self.hits = 0 # rows found in memory
+        self.misses = 0 # rows read from disk or worked out
+
+    def _spill_store(self):
+        if self.spill_dir is None:
+            return None
+
+        # a forked process can't share the parent's database
+        if self.spill_pid != os.getpid():
+            os.makedirs(self.spill_dir, exist_ok=True)
+            if os.name == 'posix':
+                _remove_dead_spills(self.spill_dir)
+            self.spill_path = tempfile.mkdtemp(prefix=f"rows.{os.getpid()}.", dir=self.spill_dir)
+            self.spill = dbm.open(os.path.join(self.spill_path, "rows"), 'n')
+            self.spill_pid = os.getpid()
+            atexit.register(self.close)
+
+        return self.spill
+
+    def row(self, guess_idx: int) -> bytes:
+        with self.lock:
+            if guess_idx in self.rows:
+                self.hits += 1
+                self.rows.move_to_end(guess_idx)
+                return self.rows[guess_idx]
+
+            self.misses += 1
+            spill = self._spill_store()
+            key = str(guess_idx)
+            if spill is not None and key in spill:
+                row = spill[key]
+            else:
+                row = self.builder.row(self.guesses[guess_idx])
+
+            self.rows[guess_idx] = row
+            self.size += len(row)
+
+            # make room, oldest first (always keeping the row just added)
+            while self.size > self.max_bytes and len(self.rows) > 1:
+                old_idx, old_row = self.rows.popitem(last=False)
+                self.size -= len(old_row)
+                if spill is not None and str(old_idx) not in spill:
+                    spill[str(old_idx)] = old_row
+
+            return row
+
+    '''
+    Close and delete this process's spill database and its directory (if there is one).
+    '''
+    def close(self):
+        if self.spill is not None and self.spill_pid == os.getpid():
+            self.spill.close()
+            shutil.rmtree(self.spill_path, ignore_errors=True)
+        self.spill = None
+        self.spill_path = None
+        self.spill_pid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+'''
+Delete spill directories in spill_dir left behind by processes that aren't running anymore.
+POSIX only: signal 0 just checks that a process exists there, but on Windows os.kill ends the process.
+A directory whose process id has been reused by a new process is kept, which is harmless.
+'''
+def _remove_dead_spills(spill_dir: str):
+    for path in glob.glob(os.path.join(spill_dir, "rows.*.*")):
+        pid = os.path.basename(path).split(".")[1]
+        if not pid.isdigit() or not os.path.isdir(path):
+            continue
+
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            shutil.rmtree(path, ignore_errors=True)
+        except PermissionError:
+            pass # running, but someone else's
+
+'''
+How many times each encoded result comes up in row, only counting the answers at indices (all of them if there are as
+many indices as answers). Wordle_Information.get_result_buckets and the python backend in batch_scoring.py both count
+with this, so their buckets always match.
+return: Counter - keys are encoded results, values are counts
+'''
+def row_counts(row, indices: List[int]) -> Counter:
+    if len(indices) == len(row):
+        return Counter(row)
+    elif len(indices) == 1:
+        return Counter([row[indices[0]]])
+    else:
+        return Counter(itemgetter(*indices)(row))
+
+'''
+Index of word in the guess list of rows, or None if there are no rows or it isn't in them (one lookup instead of two).
+'''
+def guess_index(rows, word: str) -> int:
+    if rows is None:
+        return None
+
+    try:
+        return rows.guesses.index(word)
+    except ValueError:
+        return None
+
+# rows used by Wordle_Information; made the first time they're needed
+_pattern_rows = None
+
+'''
+Get the pattern rows used for scoring guesses. The first time, this makes a Pattern_Table for GUESS_LIST and ANSWER_LIST
+if it fits in PATTERN_BYTES, or a Pattern_Row_Cache with that budget if it doesn't.
+'''
+def get_pattern_rows():
+    global _pattern_rows
+    if _pattern_rows is None:
+        if len(GUESS_LIST) * len(ANSWER_LIST) <= PATTERN_BYTES:
+            _pattern_rows = Pattern_Table()
+        else:
+            _pattern_rows = Pattern_Row_Cache(spill_dir=PATTERN_SPILL_DIR)
+
+    return _pattern_rows
+
+'''
+Use rows for scoring guesses from now on. It needs guesses and answers attributes and a row(guess_idx) method.
+'''
+def set_pattern_rows(rows):
+    global _pattern_rows
+    _pattern_rows = rows
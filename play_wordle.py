@@ -2,16 +2,25 @@
 All the code that actually plays Wordle is in here.
 """
 
+import argparse
 import json
 import random
+import threading
+import time
+from functools import partial
 from typing import List
-from tqdm import tqdm, tqdm_notebook
 
 # wordle helper objects
 from wordle_information import Wordle_Information
 from guess_info import Guess_Info
 from wordle_game import Wordle_Game
-from definitions import WORD_LIST, NUM_LETTERS
+from speculation import Speculator
+from strategies import STRATEGIES, get_strategy, score_words
+from batch_scoring import BACKENDS, score_words_batched
+from opening_book import book_guess, in_book, book_openers
+from guess_pool import reduce_guess_pool
+from game_trace import Game_Trace
+from definitions import GUESS_LIST, NUM_LETTERS
 
 '''
 Helper method to determine if a word has repeated letters.
@@ -26,11 +35,12 @@ def repeated_letters(word: str) -> bool:
 '''
 Select num random words from word_list. Words with repeated letters are removed from the return list
 because of a bug that happens when I try to guess words with repeated letters.
+Pass a seeded random.Random as rng to get the same words every time.
 '''
-def select_words(word_list: List[str], num: int) -> List[str]:
-    random.shuffle(word_list)
+def select_words(word_list: List[str], num: int, rng: random.Random=None) -> List[str]:
+    rng = rng or random
     sublist = []
-    for word in word_list[:num]:
+    for word in rng.sample(word_list, min(num, len(word_list))):
         repeat = False
         for letter in word:
             if word.count(letter) != 1:
@@ -41,56 +51,73 @@ def select_words(word_list: List[str], num: int) -> List[str]:
     return sublist
 
 '''
-Find the best guess(es) given some Wordle_Information objects and optionally a word list.
-
-infos: Wordle_Information or List[Wordle_Information] - the information to analyze
-word_list: List[str]=WORD_LIST - the words to analyze. Defaults to global WORD_LIST from words.txt
-num_choices: int=1 - the number of possible guesses to return (in decreasing order); default only 1
-num_to_analyze: int=50 - the number of words from word_list to analyze (default 50)
-shuffle_words: bool=True - whether or not to randomly select words from the word list (default yes)
-
-return: List[str, float] or List[List[str, float]] - guesses with accompanying information in a 2-item list
-    Returns a list of 2-item list if num_choices > 1
+Helper function to best_guess and compare_strategies. Checks infos and picks the words to analyze.
+If reduce_pool is True, guesses that split the possible words the same way as another (or worse) are dropped first.
+This only works with a single Wordle_Information object; see guess_pool.py.
 '''
-def best_guess(infos, word_list: List[str]=WORD_LIST, num_choices=1, num_to_analyze=50, shuffle_words=True):
+def _guess_setup(infos, word_list, num_to_analyze, shuffle_words, reduce_pool=True, show_progress=True, rng=None):
     # validate that infos is the correct type
     if type(infos) == Wordle_Information:
         infos = [infos]
-    elif not type(infos) == List[Wordle_Information]:
+    elif not (type(infos) == list and all(type(info) == Wordle_Information for info in infos)):
         raise TypeError("infos should be a single Wordle_Information object or a list of them")
-    
-    # initialize best words list
-    best = []
-    min_info = 0
+
+    # drop guesses that aren't worth scoring
+    if reduce_pool and len(infos) == 1:
+        word_list, stats = reduce_guess_pool(infos[0].get_possible_words(), word_list)
+        if show_progress:
+            print(f"Reduced {stats['words']} guesses to {stats['kept']} "
+                  f"({stats['classes']} distinct splits, {stats['dominated']} beaten by another)")
 
     # select words from word list    
     if shuffle_words:
-        words = select_words(word_list, num_to_analyze)
+        words = select_words(word_list, num_to_analyze, rng)
     else:
         words = word_list[:num_to_analyze]
 
-    # iterate through words (with progress bar)
-    for word in tqdm(words):
+    # nothing worth analyzing was picked (e.g. every word left in the pool has repeated letters);
+    # fall back to the words that are still possible so there's always something to guess
+    if not words:
+        words = list(dict.fromkeys(word for info in infos for word in info.get_possible_words()))[:max(num_to_analyze, 1)]
+        if not words:
+            raise ValueError("No words to analyze: no possible words are left")
 
-        # add up total information word would give when guessing against all Wordle_Information objects in infos
-        total_info = 0
-        for info in infos:
-            total_info += info.get_total_info(word)
-        
-        # insert into list of best words
-        if total_info > min_info:
-            insert_idx = 0
-            for data in best:
-                if total_info < data[1]:
-                    insert_idx += 1
-            
-            best.insert(insert_idx, [word, total_info])
+    return infos, words
 
-            if len(best) > num_choices:
-                best.pop()
-            
-            # update min_info to the info of the lowest word in the list
-            min_info = best[-1][1]
+'''
+Find the best guess(es) given some Wordle_Information objects and optionally a word list.
+
+infos: Wordle_Information or List[Wordle_Information] - the information to analyze
+word_list: List[str]=GUESS_LIST - the words to analyze. Defaults to global GUESS_LIST (every allowed guess)
+num_choices: int=1 - the number of possible guesses to return (in decreasing order); default only 1
+num_to_analyze: int=50 - the number of words from word_list to analyze (default 50)
+shuffle_words: bool=True - whether or not to randomly select words from the word list (default yes)
+show_progress: bool=True - whether or not to show a progress bar (turn off when running in the background)
+stop: threading.Event=None - if supplied and set partway through, analysis is abandoned and None is returned
+strategy: str or Strategy='entropy' - how to score guesses (see strategies.py)
+reduce_pool: bool=True - whether or not to skip guesses that can't beat another guess (see guess_pool.py)
+rng: random.Random=None - random number generator for selecting words (pass a seeded one for repeatable results)
+backend: str=None - score all the words at once with "numpy" or "python" (see batch_scoring.py; "numpy" falls back to
+    "python" with the same scores if NumPy isn't installed). By default words are scored one at a time.
+
+return: List[str, float] or List[List[str, float]] - guesses with accompanying scores in a 2-item list
+    Returns a list of 2-item list if num_choices > 1
+'''
+def best_guess(infos, word_list: List[str]=GUESS_LIST, num_choices=1, num_to_analyze=50, shuffle_words=True,
+               show_progress=True, stop: threading.Event=None, strategy='entropy', reduce_pool=True, rng: random.Random=None,
+               backend: str=None):
+    strategy = get_strategy(strategy)
+    infos, words = _guess_setup(infos, word_list, num_to_analyze, shuffle_words, reduce_pool, show_progress, rng)
+
+    # score words (with progress bar)
+    if backend is None:
+        scores = score_words(infos, words, [strategy], show_progress=show_progress, stop=stop)
+    else:
+        scores = score_words_batched(infos, words, [strategy], backend, show_progress=show_progress, stop=stop)
+    if scores is None:
+        return None
+
+    best = strategy.rank(scores[strategy.name])[:num_choices]
     
     # return single 2-item list if num_choices=1
     if num_choices == 1:
@@ -98,6 +125,26 @@ def best_guess(infos, word_list: List[str]=WORD_LIST, num_choices=1, num_to_anal
     else:
         return best
 
+'''
+Like best_guess, but finds the best guesses by several strategies at once. Every word is only analyzed once.
+
+strategies: List[str or Strategy] - the strategies to compare (defaults to all of them)
+
+return: dict - keys are strategy names, values are lists of num_choices [word, score] pairs from best to worst
+'''
+def compare_strategies(infos, word_list: List[str]=GUESS_LIST, num_choices=5, num_to_analyze=50, shuffle_words=True,
+                       show_progress=True, strategies=STRATEGIES.values(), reduce_pool=True, rng: random.Random=None,
+                       backend: str=None) -> dict:
+    strategies = [get_strategy(strategy) for strategy in strategies]
+    infos, words = _guess_setup(infos, word_list, num_to_analyze, shuffle_words, reduce_pool, show_progress, rng)
+
+    if backend is None:
+        scores = score_words(infos, words, strategies, show_progress=show_progress)
+    else:
+        scores = score_words_batched(infos, words, strategies, backend, show_progress=show_progress)
+
+    return {strategy.name: strategy.rank(scores[strategy.name])[:num_choices] for strategy in strategies}
+
 '''
 Helper function to play_wordle. Checks if user gave readable input for the guess_info portion.
 info: str - user input for guess info
@@ -140,128 +187,236 @@ def get_best_first_words(num = 5) -> dict:
 
 '''
 Plays a game of Wordle through the terminal. Word list to use can be optionally specified.
+
+If speculate is True (default), suggestions for the next turn are computed in the background while the user
+enters the result of their guess. See speculation.py.
+
+strategy is how guesses are scored (see strategies.py). Defaults to entropy.
+
+If use_book is True (default), the second guess is looked up in the opening book when possible. See opening_book.py.
+
+If trace_file is given, the game is appended to it when it's over (or interrupted) so it can be replayed later (see game_trace.py).
+
+backend is passed to best_guess (None scores words one at a time).
 '''
-def play_wordle(word_list: List[str] = WORD_LIST):
+def play_wordle(word_list: List[str] = GUESS_LIST, speculate=True, strategy='entropy', use_book=True, trace_file: str=None,
+                backend: str=None):
+    strategy = get_strategy(strategy)
 
     info = Wordle_Information()
     guesses = 0
-    
-    # input loop
-    while True:
+    trace = Game_Trace("interactive", strategy, backend) if trace_file else None
 
-        # prompt guess
-        if guesses == 0:
-            # if first guess, get options from stored list (too much to compute)
-            print("What word would you like to start with?")
-            print("Good options:")
-            for word in random.sample(get_best_first_words(20), 5):
-                print(f"  {word[0]} (info {word[1]:.3f})")
+    # background work on the next turn's suggestions; speculates on as many words as the user last asked for
+    speculator = None
+    num_to_analyze = 50
 
-        else:
-            # if not first guess, analyze words with best_guess
-
-            # get valid input for how many words to analyze
-            n = input("How many words would you like to analyze? ")
-            while not (n.isnumeric() and 0 <= int(n) <= len(word_list)):
-                n = input(f"Please input an integer between 10 and {len(word_list)}.")
+    # first guess and its result, for looking up the second guess in the opening book
+    opener = None
+    opener_result = None
+    
+    # answer once the game is won, and when suggestions started being worked out (while they are), for the trace
+    answer = None
+    thinking = None
 
-            n = int(n)
-            if 0 < n:
-                print(" Analyzing good options ".center(40, "#")) 
-                best_words = best_guess(info, word_list=word_list, num_choices=5, num_to_analyze=n) # analyze the words
+    # input loop (the trace is saved however the game ends, even if it's interrupted)
+    try:
+        while True:
 
+            # how this turn's suggestions were worked out, for the trace
+            seconds = 0.0
+            analyzed = 0
+            seed = None
+            source = "user"
+
+            # prompt guess
+            if guesses == 0:
+                source = "opener"
+                # if first guess, get options from stored list (too much to compute)
+                print("What word would you like to start with?")
                 print("Good options:")
-                for word in best_words:
-                    print(f"  {word[0]} (info {word[1]})") # print them
+                for word in random.sample(get_best_first_words(20), 5):
+                    print(f"  {word[0]} (info {word[1]:.3f})")
 
-            print("What word would you like to guess?")
-        
-        # get guess
-        choice = input().lower()
-        while True:
-            if repeated_letters(choice) or len(choice) != NUM_LETTERS:
-                choice = input(f"Please enter a {NUM_LETTERS}-letter word with no repeated letters: ").lower()
-                continue
+            else:
+                # if not first guess, analyze words with best_guess
 
-            if choice not in word_list:
-                yn = input("This word is not in the word list. Continue anyway? (Y/y/N/n): ")
-                while yn not in ['Y', 'y', 'N', 'n']:
-                    yn = input("Enter Y/y/N/n: ")
+                # second guess can come straight from the opening book
+                book_word = None
+                if guesses == 1 and use_book:
+                    book_word = book_guess(opener, opener_result, word_list=word_list, strategy=strategy)
 
-                if yn in "Nn":
-                    choice = input("Please enter a 5-letter word with no repeated letters: ").lower()
+                if book_word:
+                    source = "book"
+                    print(f"Opening book suggests: {book_word}")
+                else:
+                    # get valid input for how many words to analyze
+                    n = input("How many words would you like to analyze? ")
+                    while not (n.isnumeric() and 0 <= int(n) <= len(word_list)):
+                        n = input(f"Please input an integer between 10 and {len(word_list)}.")
+
+                    n = int(n)
+                    if 0 < n:
+                        print(" Analyzing good options ".center(40, "#")) 
+
+                        # use the speculator's work if it analyzed the right number of words for the right result
+                        thinking = time.perf_counter()
+                        analyzed = n
+                        best_words = None
+                        if speculator and n == num_to_analyze:
+                            source = "speculated"
+                            seed = speculator.seed
+                            best_words = speculator.get()
+                        if best_words is None:
+                            source = "live"
+                            seed = random.getrandbits(32)
+                            best_words = best_guess(info, word_list=word_list, num_choices=5, num_to_analyze=n, strategy=strategy,
+                                                    rng=random.Random(seed), backend=backend) # analyze the words
+                        seconds = time.perf_counter() - thinking
+                        thinking = None
+
+                        print("Good options:")
+                        for word in best_words:
+                            print(f"  {word[0]} ({strategy} {word[1]})") # print them
+
+                print("What word would you like to guess?")
+                if not book_word:
+                    num_to_analyze = n
+        
+            # get guess
+            choice = input().lower()
+            while True:
+                if repeated_letters(choice) or len(choice) != NUM_LETTERS:
+                    choice = input(f"Please enter a {NUM_LETTERS}-letter word with no repeated letters: ").lower()
                     continue
+
+                if choice not in word_list:
+                    yn = input("This word is not in the word list. Continue anyway? (Y/y/N/n): ")
+                    while yn not in ['Y', 'y', 'N', 'n']:
+                        yn = input("Enter Y/y/N/n: ")
+
+                    if yn in "Nn":
+                        choice = input("Please enter a 5-letter word with no repeated letters: ").lower()
+                        continue
+                    else:
+                        break
                 else:
                     break
-            else:
-                break
-
-        guesses += 1
 
-        yn = input("Was your guess correct? (Y/y/N/n) ")
-        while yn not in ['Y', 'y', 'N', 'n']:
-            yn = input("Enter Y/y/N/n: ")
+            guesses += 1
+            if guesses == 1:
+                opener = choice
+            candidates = info.count_possible_words()
+
+            # get a head start on the next turn while the user types in the result
+            # (unless the opening book already has the answer)
+            if speculator:
+                speculator.cancel()
+            speculator = None
+            if speculate and num_to_analyze > 0 and not (guesses == 1 and use_book and in_book(choice, word_list=word_list, strategy=strategy)):
+                speculator = Speculator(info, choice, word_list, num_to_analyze, partial(best_guess, strategy=strategy, backend=backend),
+                                        random.getrandbits(32))
+                speculator.start()
+
+            yn = input("Was your guess correct? (Y/y/N/n) ")
+            while yn not in ['Y', 'y', 'N', 'n']:
+                yn = input("Enter Y/y/N/n: ")
         
-        if yn.lower() == "y":
-            print(f"Congratulations! You took {guesses} guesses.")
-            yn = True
-            break
+            if yn.lower() == "y":
+                if speculator:
+                    speculator.cancel()
+                if trace:
+                    trace.add_turn(choice, [2] * NUM_LETTERS, candidates, seconds, analyzed, source, seed)
+                answer = choice
+                print(f"Congratulations! You took {guesses} guesses.")
+                yn = True
+                break
         
-        # get input for info about guess
-        result = input("Enter the result of your guess, separated by single spaces (0 is gray, 1 is yellow, 2 is green): ").strip()
-        while True:
-            # first check if input is valid
-            if not valid_guess_info_input(result):
-                result = input("Bad input. Try again: ").strip()
-                continue
+            # get input for info about guess
+            result = input("Enter the result of your guess, separated by single spaces (0 is gray, 1 is yellow, 2 is green): ").strip()
+            while True:
+                # first check if input is valid
+                if not valid_guess_info_input(result):
+                    result = input("Bad input. Try again: ").strip()
+                    continue
         
-            # next check if this causes any immediate conflicts
-            guess_info = Guess_Info(choice, [int(n) for n in result.split(' ')])
-            if not info.add_info(guess_info, temporary=True):
-                result = input("This conflicts with previous information. Input again: ")
-                info.remove_temporary_info()
-                continue
+                # next check if this causes any immediate conflicts
+                guess_info = Guess_Info(choice, [int(n) for n in result.split(' ')])
+                if not info.add_info(guess_info, temporary=True):
+                    result = input("This conflicts with previous information. Input again: ")
+                    info.remove_temporary_info()
+                    continue
             
-            # next check if this leaves any possible words
-            if info.count_possible_words() == 0:
-                result = input("This information leaves no possible valid words. Input again: ")
+                # next check if this leaves any possible words
+                if info.count_possible_words() == 0:
+                    result = input("This information leaves no possible valid words. Input again: ")
+                    info.remove_temporary_info()
+                    continue
+
+                # for some reason the user said they didn't get it right earlier
+                if guess_info.info == [2] * NUM_LETTERS:
+                    if speculator:
+                        speculator.cancel()
+                    if trace:
+                        trace.add_turn(choice, guess_info.info, candidates, seconds, analyzed, source, seed)
+                    answer = choice
+                    print(f"Congratulations! You took {guesses} guesses.")
+                    return
+
+                # valid info. Reset temporary info used for input checking and add info permanently
                 info.remove_temporary_info()
-                continue
+                info.add_info(guess_info)
+                if trace:
+                    trace.add_turn(choice, guess_info.info, candidates, seconds, analyzed, source, seed)
 
-            # for some reason the user said they didn't get it right earlier
-            if guess_info.info == [2] * NUM_LETTERS:
-                print(f"Congratulations! You took {guesses} guesses.")
-                return
+                # the real result is in; stop speculating on the others
+                if speculator:
+                    speculator.resolve(guess_info.info)
 
-            # valid info. Reset temporary info used for input checking and add info permanently
-            info.remove_temporary_info()
-            info.add_info(guess_info)
-            break
-        
-        # print remaining possible words
-        if info.count_possible_words() > 15:
-            print(f"There are {info.count_possible_words()} possible words remaining.")
-        elif info.count_possible_words() == 1:
-            print(f"Congratulations! You have eliminated all but one word. The word is: {info.get_possible_words()[0]}")
-            print(f"You took {guesses} guesses.")
-        else:
-            print("Remaining possible words:")
-            for word in info.get_possible_words():
-                if repeated_letters(word):
-                    print(f"  {word} (no info available)")
-                else:
-                    print(f"  {word} (info {info.get_total_info(word):.3f})")
+                if guesses == 1:
+                    opener_result = guess_info.info
+                break
         
+            # print remaining possible words
+            if info.count_possible_words() > 15:
+                print(f"There are {info.count_possible_words()} possible words remaining.")
+            elif info.count_possible_words() == 1:
+                print(f"Congratulations! You have eliminated all but one word. The word is: {info.get_possible_words()[0]}")
+                print(f"You took {guesses} guesses.")
+            else:
+                print("Remaining possible words:")
+                for word in info.get_possible_words():
+                    if repeated_letters(word):
+                        print(f"  {word} (no info available)")
+                    else:
+                        print(f"  {word} (info {info.get_total_info(word):.3f})")
+    finally:
+        if trace:
+            # stopped partway through working out suggestions; keep how long it had taken so far
+            if thinking is not None:
+                trace.add_turn(None, None, info.count_possible_words(), time.perf_counter() - thinking, analyzed, source, seed)
+            trace.save(trace_file, answer, solved=answer is not None)
+
 '''
 Solves the wordle represented by game object. Returns the number of guesses. 
 If show_progress is marked as true, print progress along the way.
 Returns number of guesses the bot took. If the bot can't find the word, returns None.
+strategy is how guesses are scored (see strategies.py). Defaults to entropy.
+If use_book is True (default), the second guess is looked up in the opening book when possible.
+Pass a seeded random.Random as rng to play the same way every time.
+opener is the first guess. If it's not given, one of the opening book's first words is picked at random
+(or one of a few good first words if use_book is False or there's no book).
+If trace_file is given, the game is appended to it so it can be replayed later (see game_trace.py).
+backend is passed to best_guess (None scores words one at a time).
 '''
-def play_wordle_simulated(game: Wordle_Game, word_list: List[str]=WORD_LIST, show_progress=False) -> int:
-    
+def play_wordle_simulated(game: Wordle_Game, word_list: List[str]=GUESS_LIST, show_progress=False, strategy='entropy',
+                          use_book=True, rng: random.Random=None, opener: str=None, trace_file: str=None,
+                          backend: str=None) -> int:
+    rng = rng or random
     info = Wordle_Information()
     guesses = 0
     word = " "*NUM_LETTERS # blank string NUM_LETTERS long
+    trace = Game_Trace("simulated", strategy, backend) if trace_file else None
 
     # keep guessing till the word is right
     while not game.correct_word(word):
@@ -269,43 +424,88 @@ def play_wordle_simulated(game: Wordle_Game, word_list: List[str]=WORD_LIST, sho
         num = min(50 * 4**guesses, len(word_list))
 
         # choose next guess
+        start = time.perf_counter()
+        analyzed = 0
+        seed = None
         if guesses == 0:
-            word = random.choice(['arise', 'deals', 'crane', 'adieu', 'tares'])
+            if opener is None:
+                openers = book_openers(word_list=word_list, strategy=strategy) if use_book else []
+                opener = rng.choice(openers or ['arise', 'deals', 'crane', 'adieu', 'tares'])
+            word = opener
+            source = "opener"
+        elif guesses == 1 and use_book and book_guess(opener, guess_info.info, word_list=word_list, strategy=strategy):
+            word = book_guess(opener, guess_info.info, word_list=word_list, strategy=strategy)
+            source = "book"
+            if show_progress:
+                print("Second guess from opening book")
         else:
             if show_progress:
                 print("Choosing next guess:")
-            word = best_guess(info, num_to_analyze=num)[0]
+            # each turn gets its own seed so a trace can analyze exactly the same words again
+            analyzed = num
+            seed = rng.getrandbits(32)
+            word = best_guess(info, word_list=word_list, num_to_analyze=num, show_progress=show_progress, strategy=strategy,
+                              rng=random.Random(seed), backend=backend)[0]
+            source = "live"
+        seconds = time.perf_counter() - start
 
         if show_progress:
             print(f"Guessing {word}")
         
         # guess word and add info
+        candidates = info.count_possible_words()
         guess_info = game.make_guess(word)
         guesses += 1
         info.add_info(guess_info)
+        if trace:
+            trace.add_turn(word, guess_info.info, candidates, seconds, analyzed, source, seed)
 
         if show_progress:
             print(f"Result: {guess_info.info}")
             print(f"Possible words remaining: {info.count_possible_words()}\n")
         
-        # word is correct; break
-        if info.count_possible_words() == 1:
+        # information ruled out every word (including the real one)
+        if info.count_possible_words() == 0:
+            if show_progress:
+                print("Correct word not in word list.")
+
+            if trace:
+                trace.save(trace_file, game.word)
+            return None # error
+
+        # only one word left; guess it next (unless it was just guessed)
+        if info.count_possible_words() == 1 and not game.correct_word(word):
             guesses += 1
             word = info.word_list[0]
+            if trace:
+                trace.add_turn(word, game.make_guess(word).info, 1, source="only")
             if not game.correct_word(word):
                 if show_progress:
                     print("Correct word not in word list.")
                 
+                if trace:
+                    trace.save(trace_file, game.word)
                 return None # error
     
     if show_progress:
         print(f"Solved! Solution: {word}")
         print(f"Number of guesses: {guesses}")
 
+    if trace:
+        trace.save(trace_file, game.word, solved=True)
     return guesses
 
 def main():
-    play_wordle()
+    parser = argparse.ArgumentParser(description="Get the bot's help on a game of Wordle.")
+    parser.add_argument("--strategy", choices=STRATEGIES.keys(), default="entropy", help="how to score guesses")
+    parser.add_argument("--no-speculate", action="store_true", help="don't work on the next turn while waiting for input")
+    parser.add_argument("--no-book", action="store_true", help="don't use the opening book for the second guess")
+    parser.add_argument("--trace", metavar="FILE", help="append the game to FILE so it can be replayed (see game_trace.py)")
+    parser.add_argument("--backend", choices=BACKENDS, help="score all the words at once (see batch_scoring.py)")
+    args = parser.parse_args()
+
+    play_wordle(speculate=not args.no_speculate, strategy=args.strategy, use_book=not args.no_book, trace_file=args.trace,
+                backend=args.backend)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
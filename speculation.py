@@ -0,0 +1,113 @@
+"""
+Speculative precomputation for play_wordle. While the user is busy typing in the result of their guess, the computer
+would otherwise sit around doing nothing. A Speculator uses that time to run best_guess in a background thread for the
+results that are most likely to come back, so the suggestions for the next turn are often ready by the time they're needed.
+"""
+
+import copy
+import random
+import threading
+from typing import List
+
+from guess_info import Guess_Info
+from definitions import NUM_LETTERS
+
+class Speculator:
+    '''
+    info: Wordle_Information - information before the guess (copied, so the caller can keep changing theirs)
+    guess: str - the word that was just guessed
+    word_list: List[str] - the words to pick from, like in best_guess
+    num_to_analyze: int - the number of words to analyze for every result
+    search: function - best_guess from play_wordle (passed in to avoid a circular import)
+    seed: int=None - seed for the random.Random given to search for every result. Each result's words are picked the
+        same way best_guess picks them on a normal turn (after reducing the pool for that result), so a speculated
+        turn analyzes the same words as a normal turn with the same seed would.
+    num_choices: int=5 - the number of guesses to find for each result
+    max_results: int=10 - the number of results to work through, most likely first
+    '''
+    def __init__(self, info, guess: str, word_list: List[str], num_to_analyze: int, search, seed=None, num_choices=5,
+                 max_results=10):
+        self.info = copy.deepcopy(info)
+        self.guess = guess
+        self.word_list = word_list
+        self.num_to_analyze = num_to_analyze
+        self.search = search
+        self.seed = seed
+        self.num_choices = num_choices
+
+        # results are likely in proportion to how many possible words give them
+        # an all-green result ends the game, so there's nothing to get ready for
+        buckets = self.info.get_result_buckets(guess)
+        buckets.pop(tuple([2] * NUM_LETTERS), None)
+        self.queue = sorted(buckets, key=buckets.get, reverse=True)[:max_results]
+
+        # finished results (keys are result tuples, values are the output of best_guess)
+        self.results = {}
+
+        # the result being worked on right now and the real result once the user has entered it
+        self.current = None
+        self.actual = None
+
+        # set when work on the current result should be abandoned
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    '''
+    Work through the queue of likely results in the background until it runs out or the real result shows up.
+    '''
+    def run(self):
+        for result in self.queue:
+            with self.lock:
+                if self.stop.is_set() or self.actual is not None:
+                    return
+                self.current = result
+
+            info = copy.deepcopy(self.info)
+            info.add_info(Guess_Info(self.guess, result))
+            best = self.search(info, word_list=self.word_list, num_choices=self.num_choices, num_to_analyze=self.num_to_analyze,
+                               show_progress=False, stop=self.stop, rng=random.Random(self.seed))
+
+            with self.lock:
+                self.current = None
+                if best is None:
+                    return
+                self.results[result] = best
+
+    '''
+    Tell the speculator what the real result was. Work on any other result is cancelled right away.
+    If the real result is the one being worked on, it's left to finish.
+    '''
+    def resolve(self, result):
+        result = tuple(result)
+        with self.lock:
+            self.actual = result
+            if self.current != result:
+                self.stop.set()
+
+    '''
+    Get the suggestions for the real result if they were (or are about to be) computed. Waits for the background
+    thread if it's still working on them. Returns None if the result was never speculated on.
+    '''
+    def get(self):
+        if self.actual is None:
+            return None
+
+        with self.lock:
+            done = self.results.get(self.actual)
+            working = self.current == self.actual
+
+        if done is None and working:
+            self.thread.join()
+            done = self.results.get(self.actual)
+
+        return done
+
+    '''
+    Abandon all remaining work.
+    '''
+    def cancel(self):
+        self.stop.set()
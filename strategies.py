@@ -0,0 +1,135 @@
+"""
+Ways of scoring a guess. Every strategy works off the same thing: the result buckets from
+Wordle_Information.get_result_buckets(), which say how many possible words would give each result.
+That means the buckets only need to be computed once per guess no matter how many strategies are looked at.
+"""
+
+import math
+from typing import List
+from tqdm import tqdm
+
+class Strategy:
+    name = None
+
+    # whether bigger scores are better guesses
+    higher_is_better = True
+
+    '''
+    Score a guess from its result buckets.
+    buckets: dict - keys are results, values are how many possible words give that result
+    total: int - the number of possible words (the sum of the bucket sizes)
+    return: float
+
+    NOTE: reduce_guess_pool in guess_pool.py assumes splitting a bucket up never makes the score worse.
+    '''
+    def score(self, buckets: dict, total: int) -> float:
+        raise NotImplementedError
+
+    '''
+    Sort [word, score] pairs from best to worst.
+    '''
+    def rank(self, scores: List) -> List:
+        return sorted(scores, key=lambda item: item[1], reverse=self.higher_is_better)
+
+    def __str__(self) -> str:
+        return self.name
+
+'''
+Expected information in bits: sum of p * log_2(1/p) over all results. This is what get_total_info calculates the slow way.
+'''
+class Entropy(Strategy):
+    name = "entropy"
+
+    def score(self, buckets, total):
+        info = 0
+        for count in buckets.values():
+            p = count/total
+            info += p * math.log2(1/p)
+
+        return info
+
+'''
+Expected number of possible words left after the guess. Lower is better.
+'''
+class Expected_Remaining(Strategy):
+    name = "expected"
+    higher_is_better = False
+
+    def score(self, buckets, total):
+        return sum(count * count for count in buckets.values())/total
+
+'''
+Number of possible words left in the worst case (size of the largest bucket). Lower is better.
+'''
+class Minimax(Strategy):
+    name = "minimax"
+    higher_is_better = False
+
+    def score(self, buckets, total):
+        return max(buckets.values())
+
+'''
+Number of different results the guess could give.
+'''
+class Bucket_Count(Strategy):
+    name = "buckets"
+
+    def score(self, buckets, total):
+        return len(buckets)
+
+'''
+Probability that the answer is known for sure after the guess, so it gets solved on the next turn (or already was).
+'''
+class Solve_Chance(Strategy):
+    name = "solve"
+
+    def score(self, buckets, total):
+        return sum(1 for count in buckets.values() if count == 1)/total
+
+STRATEGIES = {strategy.name: strategy for strategy in [Entropy(), Expected_Remaining(), Minimax(), Bucket_Count(), Solve_Chance()]}
+
+'''
+Look up a strategy by name. Strategy objects are passed through so either can be used anywhere.
+'''
+def get_strategy(strategy) -> Strategy:
+    if isinstance(strategy, Strategy):
+        return strategy
+
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy}. Choose from: {', '.join(STRATEGIES.keys())}")
+
+    return STRATEGIES[strategy]
+
+'''
+Score words with several strategies at once. Result buckets are computed once per word per Wordle_Information
+object and every strategy scores from them. Scores from multiple Wordle_Information objects are added up.
+
+infos: List[Wordle_Information] - the information to score against
+words: List[str] - the words to score
+strategies: List[Strategy or str] - the strategies to use
+show_progress: bool=True - whether or not to show a progress bar
+stop: threading.Event=None - if supplied and set partway through, scoring is abandoned and None is returned
+
+return: dict - keys are strategy names, values are lists of [word, score] in the order of words
+'''
+def score_words(infos, words: List[str], strategies, show_progress=True, stop=None) -> dict:
+    strategies = [get_strategy(strategy) for strategy in strategies]
+    scores = {strategy.name: [] for strategy in strategies}
+
+    for word in tqdm(words, disable=not show_progress):
+
+        # caller doesn't need the answer anymore
+        if stop and stop.is_set():
+            return None
+
+        totals = [0] * len(strategies)
+        for info in infos:
+            buckets = info.get_result_buckets(word)
+            total = len(info.word_list)
+            for idx, strategy in enumerate(strategies):
+                totals[idx] += strategy.score(buckets, total)
+
+        for idx, strategy in enumerate(strategies):
+            scores[strategy.name].append([word, totals[idx]])
+
+    return scores
@@ -0,0 +1,63 @@
+import random
+from functools import lru_cache
+
+from adversarial import Minimax_Solver, ALL_GREEN, play_absurdle_simulated
+from play_wordle import repeated_letters
+from wordle_game import Wordle_Game, Absurdle_Game
+from definitions import GUESS_LIST
+
+CANDIDATES = ["baker", "maker", "taker", "waker", "faker", "hater", "water", "later"]
+GUESSES = CANDIDATES + random.Random(0).sample([word for word in GUESS_LIST if not repeated_letters(word)], 15)
+
+'''
+Worst case number of guesses by trying every guess at every step (no pruning).
+'''
+@lru_cache(maxsize=None)
+def brute_force(candidates: tuple):
+    if len(candidates) == 1:
+        return 1
+
+    best = None
+    for guess in GUESSES:
+        buckets = {}
+        for answer in candidates:
+            buckets.setdefault(Wordle_Game(answer).make_guess(guess).info, []).append(answer)
+        if max(len(bucket) for bucket in buckets.values()) == len(candidates):
+            continue
+
+        worst = max(1 if result == ALL_GREEN else 1 + brute_force(tuple(bucket)) for result, bucket in buckets.items())
+        if best is None or worst < best:
+            best = worst
+
+    return best
+
+def test_solve_is_exact_with_full_width():
+    solver = Minimax_Solver(GUESSES, guess_width=None)
+    value, guess = solver.solve(CANDIDATES)
+
+    assert value == brute_force(tuple(CANDIDATES))
+    assert guess in GUESSES
+
+def test_narrow_search_is_still_a_guarantee():
+    solver = Minimax_Solver(guess_width=3)
+    value, _ = solver.solve(CANDIDATES)
+
+    # the host always picks the worst result, so the game can't take longer than the bound
+    assert play_absurdle_simulated(Absurdle_Game(CANDIDATES), solver) <= value
+
+def test_never_guesses_repeated_letters():
+    solver = Minimax_Solver(["robot", "llama"] + GUESSES)
+
+    assert not any(repeated_letters(word) for word in solver.guess_list)
+    for guess, _ in solver.ordered_guesses(CANDIDATES):
+        assert not repeated_letters(guess)
+
+def test_partition_matches_make_guess():
+    solver = Minimax_Solver()
+    words = random.Random(1).sample(list(GUESS_LIST), 200)
+    for guess in ["crane", "doubt", "zzzzz"]:
+        expected = {}
+        for answer in words:
+            expected.setdefault(Wordle_Game(answer).make_guess(guess).info, []).append(answer)
+
+        assert solver.partition(guess, words) == expected
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+import batch_scoring
+from batch_scoring import score_words_batched, score_pool, get_backend
+from patterns import Pattern_Row_Cache, get_pattern_rows, set_pattern_rows
+from play_wordle import best_guess
+from strategies import STRATEGIES, Strategy, score_words
+from definitions import GUESS_LIST, ANSWER_LIST
+
+POSITIONS = [
+    ("pilot", []),
+    ("pilot", ["crane"]),
+    ("fixes", ["adieu", "rings"]),
+    ("stets", ["tares", "lento"]),
+]
+
+# includes a word that isn't in the pattern rows
+WORDS = random.Random(0).sample(list(GUESS_LIST), 300) + ["zzzzq"]
+
+@pytest.mark.parametrize("answer, guesses", POSITIONS)
+def test_backends_match(answer, guesses, position_info):
+    info = position_info(answer, guesses)
+    strategies = list(STRATEGIES)
+
+    with_numpy = score_words_batched([info], WORDS, strategies, "numpy", show_progress=False)
+    with_python = score_words_batched([info], WORDS, strategies, "python", show_progress=False)
+    one_at_a_time = score_words([info], WORDS, strategies, show_progress=False)
+
+    # exactly the same, even the floating point scores
+    assert with_numpy == with_python
+
+    for name in strategies:
+        for batched, scalar in zip(with_numpy[name], one_at_a_time[name]):
+            assert batched[0] == scalar[0]
+            assert batched[1] == pytest.approx(scalar[1], abs=1e-9)
+
+def test_custom_strategy_and_several_infos(position_info):
+    class Half(Strategy):
+        name = "half"
+
+        def score(self, buckets, total):
+            return sum(count for count in buckets.values() if 2 * count <= total)/total
+
+    infos = [position_info(*position) for position in POSITIONS[1:]]
+    strategies = [Half(), "entropy"]
+
+    assert (score_words_batched(infos, WORDS, strategies, "numpy", show_progress=False)
+            == score_words_batched(infos, WORDS, strategies, "python", show_progress=False))
+
+@pytest.mark.skipif(batch_scoring.np is None, reason="NumPy isn't installed")
+def test_pool_scores_are_arrays(position_info):
+    info = position_info("pilot", ["crane"])
+
+    scores = score_pool(info, WORDS[:10], ["entropy"], "numpy")["entropy"]
+    assert isinstance(scores, batch_scoring.np.ndarray)
+    assert scores.shape == (10,)
+
+def test_small_chunks_and_row_cache(monkeypatch, position_info):
+    info = position_info("pilot", ["crane"])
+    expected = score_words_batched([info], WORDS, ["entropy"], "numpy", show_progress=False)
+
+    # a few rows per chunk, read through a cache that only holds a few rows
+    monkeypatch.setattr(batch_scoring, "CHUNK_BYTES", 7 * len(ANSWER_LIST))
+    rows = get_pattern_rows()
+    set_pattern_rows(Pattern_Row_Cache(max_bytes=5 * len(ANSWER_LIST)))
+    try:
+        assert score_words_batched([info], WORDS, ["entropy"], "numpy", show_progress=False) == expected
+        assert score_words_batched([info], WORDS, ["entropy"], "python", show_progress=False) == expected
+    finally:
+        set_pattern_rows(rows)
+
+def test_falls_back_without_numpy(monkeypatch, position_info):
+    info = position_info("fixes", ["adieu"])
+    expected = score_words_batched([info], WORDS, ["entropy"], "python", show_progress=False)
+
+    monkeypatch.setattr(batch_scoring, "np", None)
+    assert get_backend("numpy") == "python"
+    assert score_words_batched([info], WORDS, ["entropy"], "numpy", show_progress=False) == expected
+
+    with pytest.raises(ValueError):
+        get_backend("fortran")
+
+def test_best_guess_backends_agree(position_info):
+    info = position_info("pilot", ["crane"])
+    picks = [best_guess(info, num_to_analyze=200, show_progress=False, rng=random.Random(3), backend=backend)
+             for backend in [None, "numpy", "python"]]
+
+    assert picks[1] == picks[2]
+    assert picks[0][0] == picks[1][0]
+    assert picks[0][1] == pytest.approx(picks[1][1])
@@ -0,0 +1,28 @@
+from benchmark import best_of, find_regressions
+
+BASELINE = {'fast': 0.001, 'slow': 1.0}
+
+def test_threshold():
+    assert find_regressions({'slow': 1.2}, BASELINE, 0.25) == []
+    [message] = find_regressions({'slow': 1.3}, BASELINE, 0.25)
+    assert message.startswith("slow: 1.3000")
+
+    # only the metrics in both are compared
+    assert find_regressions({'slow': 1.0, 'new': 5.0}, BASELINE, 0.25) == []
+    assert find_regressions({}, BASELINE, 0.25) == []
+
+def test_min_delta():
+    # three times slower, but only by 2ms
+    assert find_regressions({'fast': 0.003}, BASELINE, 0.25) == []
+    assert len(find_regressions({'fast': 0.003}, BASELINE, 0.25, min_delta=0.001)) == 1
+    assert len(find_regressions({'fast': 0.007}, BASELINE, 0.25)) == 1
+
+def test_retries_keep_the_best_time():
+    runs = [{'fast': 0.01, 'slow': 1.0}, {'fast': 0.001, 'slow': 2.0}, {'slow': 1.5}]
+
+    assert best_of(runs) == {'fast': 0.001, 'slow': 1.0}
+    assert best_of(runs[:1]) == runs[0]
+
+    # a slow first run passes once a retry is as fast as the baseline
+    assert find_regressions(runs[1], BASELINE, 0.25)
+    assert not find_regressions(best_of(runs[:2]), BASELINE, 0.25)
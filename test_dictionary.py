@@ -0,0 +1,60 @@
+import random
+import string
+
+import pytest
+
+from dictionary import Packed_Words, load_dictionaries
+
+def test_packed_words_works_like_a_list():
+    rng = random.Random(0)
+    words = ["".join(rng.choice("abcde") for _ in range(5)) for _ in range(5000)]
+
+    packed = Packed_Words(5)
+    added = [word for word in words if packed.add(word.encode("ascii"))]
+    unique = list(dict.fromkeys(words))
+
+    assert added == unique
+    assert len(packed) == len(unique)
+    assert list(packed) == unique
+    assert packed[-1] == unique[-1]
+    assert packed[3:7] == unique[3:7]
+    for idx, word in enumerate(unique):
+        assert word in packed
+        assert packed.index(word) == idx
+
+def test_index_between():
+    packed = Packed_Words(5)
+    for word in [b"crane", b"slate", b"plumb", b"zesty"]:
+        packed.add(word)
+    words = list(packed)
+
+    for args in [(1,), (2,), (0, 2), (0, 1), (-2,), (-3, -1), (5,), (3, 1)]:
+        for word in words:
+            if word in words[slice(*args) if len(args) == 2 else slice(args[0], None)]:
+                assert packed.index(word, *args) == words.index(word, *args)
+            else:
+                with pytest.raises(ValueError):
+                    packed.index(word, *args)
+
+def test_missing_words():
+    packed = Packed_Words(5)
+    packed.add(b"crane")
+
+    for word in ["slate", "cran", "cranes", "CRANE", "cráne", 5, None]:
+        assert word not in packed
+        with pytest.raises(ValueError):
+            packed.index(word)
+
+    with pytest.raises(IndexError):
+        packed[1]
+
+def test_load_dictionaries(tmp_path):
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("Crane\nslate\nab\ncrane\nno-go\r\nplumb\ntoolong\nzesty")
+    second.write_text("slate\ndoubt\n")
+
+    # tiny chunks so lines get split across them
+    words = load_dictionaries([str(first), str(second)], 5, string.ascii_lowercase, chunk_size=3)
+
+    assert list(words) == ["crane", "slate", "plumb", "zesty", "doubt"]
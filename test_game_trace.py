@@ -0,0 +1,72 @@
+import random
+
+from game_trace import Game_Trace, TURN_FIELDS, load_traces, replay_trace
+from speculation import Speculator
+from wordle_information import Wordle_Information
+import play_wordle
+from play_wordle import play_wordle_simulated
+from wordle_game import Wordle_Game
+from definitions import GUESS_LIST, decode_result
+
+def test_simulated_game_round_trip(tmp_path, monkeypatch):
+    real = play_wordle.best_guess
+    trace_file = str(tmp_path / "traces.jsonl")
+    guesses = play_wordle_simulated(Wordle_Game("pilot"), rng=random.Random(1), use_book=False, trace_file=trace_file,
+                                    backend="python")
+
+    [trace] = load_traces(trace_file)
+    assert trace['answer'] == "pilot"
+    assert trace['backend'] == "python"
+    assert trace['solved']
+    assert len(trace['turns']) == guesses
+
+    turns = [dict(zip(TURN_FIELDS, turn)) for turn in trace['turns']]
+    assert turns[0]['source'] == "opener"
+    assert turns[-1]['guess'] == "pilot"
+    assert decode_result(turns[-1]['result']) == (2, 2, 2, 2, 2)
+
+    # every turn that called best_guess is replayed against the same possible words, with the same backend
+    calls = []
+    monkeypatch.setattr(play_wordle, "best_guess", lambda *args, **kwargs: calls.append(kwargs['backend']) or real(*args, **kwargs))
+    replayed = replay_trace(trace)
+    assert calls and all(backend == "python" for backend in calls)
+    assert len(replayed) == sum(1 for turn in turns if turn['source'] == "live")
+    assert all(turn['matches'] for turn in replayed)
+
+def test_interrupted_turn(tmp_path):
+    trace_file = str(tmp_path / "traces.jsonl")
+    game = Wordle_Game("pilot")
+
+    trace = Game_Trace("interactive")
+    trace.add_turn("crane", game.make_guess("crane").info, 5757, source="opener")
+    trace.add_turn(None, None, 738, 12.5, 40, "live", 7)
+    trace.save(trace_file)
+
+    [saved] = load_traces(trace_file)
+    assert not saved['solved']
+    assert saved['turns'][-1][:2] == [None, None]
+
+    [turn] = replay_trace(saved)
+    assert turn['recorded'] == 12.5
+    assert turn['matches']
+
+def test_speculated_turn_replays_the_same_words(tmp_path, monkeypatch):
+    real = play_wordle.best_guess
+    trace_file = str(tmp_path / "traces.jsonl")
+
+    # work out the most likely result in the foreground
+    speculator = Speculator(Wordle_Information(), "crane", GUESS_LIST, 30, real, seed=5, max_results=1)
+    [result] = speculator.queue
+    speculator.run()
+
+    # stopped while waiting on the speculator
+    trace = Game_Trace("interactive")
+    trace.add_turn("crane", result, 5757, source="opener")
+    trace.add_turn(None, None, 0, 1.5, 30, "speculated", speculator.seed)
+    trace.save(trace_file)
+
+    replayed = []
+    monkeypatch.setattr(play_wordle, "best_guess", lambda *args, **kwargs: replayed.append(real(*args, **kwargs)))
+    [turn] = replay_trace(load_traces(trace_file)[0])
+    assert turn['source'] == "speculated"
+    assert replayed == [speculator.results[result]]
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from guess_pool import reduce_guess_pool
+from play_wordle import best_guess, play_wordle_simulated, repeated_letters
+from strategies import STRATEGIES, score_words
+from wordle_game import Wordle_Game
+from definitions import GUESS_LIST
+
+# (answer, guesses played) for positions partway through a game
+POSITIONS = [
+    ("shine", ["crane", "doubt"]),
+    ("pilot", ["crane"]),
+    ("galls", ["tares"]),
+    ("faker", ["tares", "choir"]),
+]
+
+@pytest.mark.parametrize("answer, guesses", POSITIONS)
+def test_best_score_unchanged(answer, guesses, position_info):
+    info = position_info(answer, guesses)
+    words = [word for word in GUESS_LIST if not repeated_letters(word)]
+    kept, _ = reduce_guess_pool(info.get_possible_words(), GUESS_LIST)
+
+    full = score_words([info], words, STRATEGIES.values(), show_progress=False)
+    reduced = score_words([info], kept, STRATEGIES.values(), show_progress=False)
+    for strategy in STRATEGIES.values():
+        assert strategy.rank(reduced[strategy.name])[0][1] == pytest.approx(strategy.rank(full[strategy.name])[0][1])
+
+@pytest.mark.parametrize("candidates", [
+    ["raker", "faker"],
+    ["baker", "maker", "taker", "waker"],
+    ["hills", "fills", "pills"],
+    ["shine"],
+])
+def test_candidates_kept(candidates):
+    kept, stats = reduce_guess_pool(candidates, GUESS_LIST)
+
+    assert kept
+    assert stats['kept'] == len(kept)
+    assert not any(repeated_letters(word) for word in kept)
+    for word in candidates:
+        if not repeated_letters(word):
+            assert word in kept
+
+def test_best_guess_with_nothing_to_analyze(position_info):
+    info = position_info("galls", ["tares"])
+
+    # every word in the pool has repeated letters, so it falls back to the possible words
+    word, _ = best_guess(info, word_list=["hills", "fills"], show_progress=False)
+    assert word in info.get_possible_words()
+
+def test_simulated_game_with_repeated_letters():
+    assert play_wordle_simulated(Wordle_Game("galls"), rng=random.Random(4)) is not None
+
+def test_yellow_letter_already_green(position_info):
+    # the a in agent is yellow because of the green a in galls, so galls is still possible
+    info = position_info("galls", ["tales", "whelm", "pubic", "agent"])
+    assert "galls" in info.get_possible_words()
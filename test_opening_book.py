@@ -0,0 +1,74 @@
+import random
+from copy import deepcopy
+
+from opening_book import (BOOK_FILE, new_opening_book, add_opener, save_opening_book, load_opening_book, book_guess, in_book,
+                          book_openers)
+from game_trace import TURN_FIELDS, load_traces
+from play_wordle import play_wordle_simulated, best_guess, repeated_letters
+from wordle_game import Wordle_Game
+from wordle_information import Wordle_Information
+from guess_info import Guess_Info
+from definitions import GUESS_LIST, NUM_LETTERS, decode_result
+
+def test_round_trip(tmp_path):
+    book_file = str(tmp_path / "book.json")
+    book = new_opening_book(strategy='minimax')
+    add_opener(book, "crane", {(0, 0, 0, 0, 0): "doubt", (2, 2, 2, 2, 0): "crank"})
+    save_opening_book(book, book_file)
+
+    assert in_book("crane", book_file, strategy='minimax')
+    assert not in_book("slate", book_file, strategy='minimax')
+    assert book_guess("crane", (0, 0, 0, 0, 0), book_file, strategy='minimax') == "doubt"
+    assert book_guess("crane", [2, 2, 2, 2, 0], book_file, strategy='minimax') == "crank"
+    assert book_guess("crane", (1, 0, 0, 0, 0), book_file, strategy='minimax') is None
+
+def test_strategy_must_match(tmp_path):
+    book_file = str(tmp_path / "book.json")
+    book = new_opening_book(strategy='minimax')
+    add_opener(book, "crane", {(0, 0, 0, 0, 0): "doubt"})
+    save_opening_book(book, book_file)
+
+    assert load_opening_book(book_file, strategy='entropy') is None
+    assert book_guess("crane", (0, 0, 0, 0, 0), book_file, strategy='entropy') is None
+
+def test_simulated_games_use_the_book(tmp_path):
+    trace_file = str(tmp_path / "traces.jsonl")
+    for seed, answer in enumerate(["pilot", "shine", "faker"]):
+        play_wordle_simulated(Wordle_Game(answer), rng=random.Random(seed), trace_file=trace_file)
+
+    for trace in load_traces(trace_file):
+        opener, second = [dict(zip(TURN_FIELDS, turn)) for turn in trace['turns'][:2]]
+        assert opener['guess'] in book_openers()
+        assert second['source'] == "book"
+        assert second['guess'] == book_guess(opener['guess'], decode_result(opener['result']))
+
+def test_word_list_must_match():
+    # same length, different order: the indices in the book would point at the wrong words
+    shuffled = random.Random(0).sample(list(GUESS_LIST), len(GUESS_LIST))
+
+    assert load_opening_book(BOOK_FILE) is not None
+    assert load_opening_book(BOOK_FILE, word_list=shuffled) is None
+
+def test_stored_guesses_are_best_guesses():
+    book = load_opening_book(BOOK_FILE)
+    guesses = [word for word in GUESS_LIST if not repeated_letters(word)]
+    rng = random.Random(0)
+    single = 0
+    for opener in book['openers']:
+        info = Wordle_Information()
+        results = [result for result in info.get_result_buckets(opener) if result != tuple([2] * NUM_LETTERS)]
+        for result in rng.sample(results, 5) + results[-20:]:
+            # same as build_opening_book
+            after = deepcopy(info)
+            after.add_info(Guess_Info(opener, result))
+            guess = book_guess(opener, result)
+
+            if len(after.word_list) == 1:
+                # one word left: the book should just guess it
+                assert guess == after.word_list[0]
+                single += 1
+            elif after.word_list:
+                assert guess == best_guess(after, word_list=guesses, num_to_analyze=len(guesses), shuffle_words=False,
+                                           show_progress=False)[0]
+
+    assert single
@@ -0,0 +1,64 @@
+import os
+import random
+from collections import Counter
+
+from patterns import Pattern_Table, Pattern_Row_Cache, row_counts
+from wordle_game import Wordle_Game
+from definitions import GUESS_LIST, ANSWER_LIST, encode_result
+
+GUESSES = random.Random(0).sample(list(GUESS_LIST), 30)
+
+def test_rows_match_make_guess():
+    table = Pattern_Table(GUESSES)
+    for idx, guess in enumerate(GUESSES[:5]):
+        expected = bytes(encode_result(Wordle_Game(answer).make_guess(guess).info) for answer in ANSWER_LIST)
+        assert table.row(idx) == expected
+
+def test_row_counts():
+    row = Pattern_Table(GUESSES).row(0)
+    for indices in [list(range(len(row))), [7], [3, 3, 9], random.Random(1).sample(range(len(row)), 100)]:
+        assert row_counts(row, indices) == Counter(row[idx] for idx in indices)
+
+def test_cache_matches_table(tmp_path):
+    table = Pattern_Table(GUESSES)
+
+    # room for 3 rows, so most of them get pushed out and read back from disk
+    with Pattern_Row_Cache(GUESSES, max_bytes=3 * len(ANSWER_LIST), spill_dir=str(tmp_path)) as cache:
+        for _ in range(2):
+            for idx in range(len(GUESSES)):
+                assert cache.row(idx) == table.row(idx)
+
+        assert cache.size <= 3 * len(ANSWER_LIST)
+        assert cache.hits + cache.misses == 2 * len(GUESSES)
+
+def test_spill_is_deleted(tmp_path):
+    # left behind by a process that isn't running anymore
+    (tmp_path / "rows.999999999.abc").mkdir()
+    (tmp_path / "rows.999999999.abc" / "rows.dat").write_bytes(b"")
+
+    cache = Pattern_Row_Cache(GUESSES, max_bytes=len(ANSWER_LIST), spill_dir=str(tmp_path))
+    for idx in range(5):
+        cache.row(idx)
+
+    [spill] = [name for name in os.listdir(tmp_path) if not name.startswith("rows.999999999")]
+    assert spill.startswith(f"rows.{os.getpid()}.")
+    if os.name == 'posix':
+        assert os.listdir(tmp_path) == [spill]
+
+    cache.close()
+    assert spill not in os.listdir(tmp_path)
+
+def test_two_caches_in_one_process(tmp_path):
+    first = Pattern_Row_Cache(GUESSES, max_bytes=len(ANSWER_LIST), spill_dir=str(tmp_path))
+    second = Pattern_Row_Cache(GUESSES, max_bytes=len(ANSWER_LIST), spill_dir=str(tmp_path))
+    for idx in range(5):
+        first.row(idx)
+        second.row(idx)
+
+    # closing one doesn't touch the other's database
+    first.close()
+    assert len(os.listdir(tmp_path)) == 1
+    assert second.row(0) == Pattern_Table(GUESSES).row(0)
+
+    second.close()
+    assert not os.listdir(tmp_path)
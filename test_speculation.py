@@ -0,0 +1,83 @@
+import copy
+import random
+import threading
+
+from speculation import Speculator
+from play_wordle import best_guess
+from guess_info import Guess_Info
+from definitions import GUESS_LIST
+
+GUESS = "doubt"
+NUM_TO_ANALYZE = 30
+SEED = 1
+
+class Paused_Search:
+    '''
+    best_guess that waits to be let go before it starts, so the tests know what the speculator is working on.
+    '''
+    def __init__(self):
+        self.started = threading.Event()
+        self.go = threading.Event()
+        self.calls = []
+
+    def __call__(self, info, **kwargs):
+        self.calls.append(info)
+        self.started.set()
+        self.go.wait()
+        return best_guess(info, **kwargs)
+
+def make_speculator(position_info, search):
+    return Speculator(position_info("pilot", ["crane"]), GUESS, GUESS_LIST, NUM_TO_ANALYZE, search, SEED)
+
+def test_resolve_with_result_in_progress(position_info):
+    search = Paused_Search()
+    speculator = make_speculator(position_info, search)
+    speculator.start()
+    search.started.wait()
+
+    result = speculator.queue[0]
+    speculator.resolve(list(result))
+    search.go.set()
+
+    # waits for the result being worked on; same words as a normal turn with the same seed
+    info = copy.deepcopy(speculator.info)
+    info.add_info(Guess_Info(GUESS, result))
+    expected = best_guess(info, word_list=GUESS_LIST, num_choices=5, num_to_analyze=NUM_TO_ANALYZE, show_progress=False,
+                          rng=random.Random(SEED))
+    assert speculator.get() == expected
+
+    # nothing else gets worked on once the result is known
+    speculator.thread.join()
+    assert len(search.calls) == 1
+
+def test_resolve_with_other_result(position_info):
+    search = Paused_Search()
+    speculator = make_speculator(position_info, search)
+    speculator.start()
+    search.started.wait()
+
+    speculator.resolve(speculator.queue[1])
+    assert speculator.stop.is_set()
+    search.go.set()
+
+    speculator.thread.join()
+    assert speculator.get() is None
+    assert speculator.results == {}
+    assert len(search.calls) == 1
+
+def test_cancel_when_not_running(position_info):
+    search = Paused_Search()
+    speculator = make_speculator(position_info, search)
+
+    # nothing started yet
+    speculator.cancel()
+    assert speculator.get() is None
+
+    speculator.start()
+    speculator.thread.join()
+    assert search.calls == []
+
+    # already finished
+    speculator.cancel()
+    speculator.resolve(speculator.queue[0])
+    assert speculator.get() is None
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from strategies import STRATEGIES, Strategy, get_strategy
+from play_wordle import best_guess, compare_strategies
+
+# 8 possible words split 4/2/1/1
+BUCKETS = {(0, 0, 0, 0, 0): 4, (1, 0, 0, 0, 0): 2, (2, 0, 0, 0, 0): 1, (2, 2, 0, 0, 0): 1}
+TOTAL = 8
+
+@pytest.mark.parametrize("name, expected", [
+    # 1/2 * 1 bit + 1/4 * 2 bits + 2 * (1/8 * 3 bits)
+    ("entropy", 1.75),
+    # (4*4 + 2*2 + 1*1 + 1*1)/8
+    ("expected", 2.75),
+    ("minimax", 4),
+    ("buckets", 4),
+    # 2 of the 8 words are alone in their bucket
+    ("solve", 0.25),
+])
+def test_scores(name, expected):
+    assert STRATEGIES[name].score(BUCKETS, TOTAL) == pytest.approx(expected)
+
+def test_one_bucket():
+    scores = {name: strategy.score({(0, 0, 0, 0, 0): 8}, TOTAL) for name, strategy in STRATEGIES.items()}
+    assert scores == {"entropy": 0, "expected": 8, "minimax": 8, "buckets": 1, "solve": 0}
+
+def test_rank():
+    scores = [["worse", 1.0], ["better", 2.0]]
+    assert STRATEGIES["entropy"].rank(scores)[0][0] == "better"
+    assert STRATEGIES["minimax"].rank(scores)[0][0] == "worse"
+
+def test_get_strategy():
+    assert get_strategy("minimax") is STRATEGIES["minimax"]
+    assert get_strategy(STRATEGIES["solve"]) is STRATEGIES["solve"]
+    with pytest.raises(ValueError):
+        get_strategy("luck")
+    with pytest.raises(NotImplementedError):
+        Strategy().score(BUCKETS, TOTAL)
+
+@pytest.mark.parametrize("backend", [None, "python"])
+def test_compare_strategies(position_info, backend):
+    info = position_info("pilot", ["crane"])
+    compared = compare_strategies(info, num_choices=3, num_to_analyze=40, show_progress=False, rng=random.Random(2),
+                                  backend=backend)
+
+    assert list(compared) == list(STRATEGIES)
+    for name, choices in compared.items():
+        assert len(choices) == 3
+        assert choices == STRATEGIES[name].rank(choices)
+
+        # same words analyzed, so the same best guess as asking for just this strategy
+        best = best_guess(info, num_to_analyze=40, show_progress=False, strategy=name, rng=random.Random(2), backend=backend)
+        assert best == choices[0]
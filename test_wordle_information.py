@@ -0,0 +1,82 @@
+import copy
+
+import pytest
+
+from wordle_information import Wordle_Information
+from wordle_game import Wordle_Game
+from guess_info import Guess_Info
+from patterns import Pattern_Table, get_pattern_rows, set_pattern_rows
+from strategies import score_words
+from batch_scoring import score_words_batched
+
+# answers are a small part of the guesses, like with an answers.txt
+ANSWERS = ["pilot", "shine", "faker", "plink", "doubt", "pinto", "spilt", "tonic"]
+GUESSES = ANSWERS + ["crane", "adieu", "lints", "moist"]
+
+@pytest.fixture(params=["table", "other rows"])
+def rows(request):
+    old = get_pattern_rows()
+    # "other rows" are made for a different answer list, so nothing can be read from them
+    rows = Pattern_Table(GUESSES, ANSWERS) if request.param == "table" else old
+    set_pattern_rows(rows)
+    yield rows
+    set_pattern_rows(old)
+
+def expected_buckets(info, guess):
+    buckets = {}
+    for answer in info.word_list:
+        result = Wordle_Game(answer).make_guess(guess).info
+        buckets[result] = buckets.get(result, 0) + 1
+
+    return buckets
+
+def test_separate_answers(rows):
+    info = Wordle_Information(ANSWERS)
+    assert (info.pattern_rows() is rows) == (rows.answers is ANSWERS)
+
+    info.add_info(Wordle_Game("pilot").make_guess("crane"))
+    assert set(info.word_list) <= set(ANSWERS)
+    assert info.candidate_indices() == [ANSWERS.index(word) for word in info.word_list]
+
+    # copies can still read the rows
+    assert copy.deepcopy(info).pattern_rows() is info.pattern_rows()
+
+    for guess in GUESSES:
+        buckets = info.get_result_buckets(guess)
+        assert buckets == expected_buckets(info, guess)
+        assert sum(buckets.values()) == len(info.word_list)
+
+def test_guesses_that_cant_be_answers_are_scored(rows):
+    info = Wordle_Information(ANSWERS)
+    info.add_info(Wordle_Game("pilot").make_guess("adieu"))
+    others = [word for word in GUESSES if word not in ANSWERS]
+
+    scalar = score_words([info], others, ["minimax"], show_progress=False)["minimax"]
+    assert [word for word, _ in scalar] == others
+    assert [score for _, score in scalar] == [max(expected_buckets(info, word).values()) for word in others]
+
+    for backend in ["numpy", "python"]:
+        assert score_words_batched([info], others, ["minimax"], backend, show_progress=False)["minimax"] == scalar
+
+class Counted_List(list):
+    def __init__(self, words):
+        super().__init__(words)
+        self.lookups = 0
+
+    def index(self, *args):
+        self.lookups += 1
+        return super().index(*args)
+
+def test_indices_follow_word_list():
+    answers = Counted_List(ANSWERS)
+    info = Wordle_Information(answers)
+    game = Wordle_Game("pilot")
+
+    info.add_info(game.make_guess("crane"))
+    info.add_info(Guess_Info("doubt", (0, 1, 0, 0, 1)), temporary=True)
+    info.remove_temporary_info()
+    info.add_info(game.make_guess("lints"))
+
+    # filtered along with the words instead of looked up one at a time
+    assert info.candidate_indices() == [ANSWERS.index(word) for word in info.word_list]
+    assert answers.lookups == 0
@@ -1,7 +1,9 @@
 """
-A simple class to represent a game of Wordle. Used for simulations.
+Simple classes to represent a game of Wordle. Used for simulations.
 """
-from definitions import NUM_LETTERS
+from typing import List
+
+from definitions import NUM_LETTERS, encode_result
 
 from guess_info import Guess_Info
 
@@ -27,4 +29,33 @@ class Wordle_Game:
 		return Guess_Info(word, tuple(info))
 
 	def correct_word(self, word: str) -> bool:
-		return self.word == word
\ No newline at end of file
+		return self.word == word
+
+'''
+An adversarial game of Wordle (like Absurdle). The host never picks an answer. After each guess it gives back whichever
+result keeps the most words possible, so the only way to win is to narrow it down to one word and guess it.
+'''
+class Absurdle_Game:
+	def __init__(self, word_list: List[str]):
+		self.word_list = list(word_list) # words the host could still claim are the answer
+
+	'''
+	Give the result that leaves the most possible words. Ties go to the result with the lowest encode_result() code,
+	which compares results letter by letter from the first one (gray before yellow before green), not by how many
+	greens and yellows they have. All green has the highest code, so the host never gives it up unless it has to.
+	word: 5-letter word
+	return: Guess_Info object
+	'''
+	def make_guess(self, word: str) -> Guess_Info:
+		buckets = {}
+		for answer in self.word_list:
+			result = Wordle_Game(answer).make_guess(word).info
+			buckets.setdefault(result, []).append(answer)
+
+		result = max(buckets, key=lambda result: (len(buckets[result]), -encode_result(result)))
+		self.word_list = buckets[result]
+
+		return Guess_Info(word, result)
+
+	def correct_word(self, word: str) -> bool:
+		return self.word_list == [word]
@@ -5,12 +5,17 @@ information in valid_word() and seamlessly add information for new guesses in ad
 how good a guess with the basics of information theory in get_total_info(). See comments and docstrings!
 """
 
-import math, random
+import copy
+import math
+from itertools import compress
 from types import SimpleNamespace
+from typing import List
 from tqdm import tqdm
 
 from guess_info import Guess_Info
-from definitions import WORD_LIST, NUM_LETTERS, result_configs
+from wordle_game import Wordle_Game
+from definitions import ANSWER_LIST, NUM_LETTERS, result_configs, decode_result
+from patterns import get_pattern_rows, guess_index, row_counts
 
 class GuessNotPossibleException(Exception):
     """Exception raised when invalid guess info is supplied to add_info function.
@@ -26,7 +31,10 @@ class GuessNotPossibleException(Exception):
         super().__init__(self.message)
 
 class Wordle_Information:
-    def __init__(self):
+    '''
+    answers: List[str]=ANSWER_LIST - the words that could be the answer. Guesses can be any word.
+    '''
+    def __init__(self, answers: List[str]=ANSWER_LIST):
 
         # New way of storing data (filled with example data)
         # 
@@ -101,8 +109,25 @@ class Wordle_Information:
         self.temp_changes = SimpleNamespace(**self.temp_changes_dict)
 
         self.result_configs = result_configs()
-        self.word_list = WORD_LIST
+        self.answers = answers
+        self.word_list = answers # possible answers
+
+        # indices of the words in word_list in answers, for reading pattern rows (see candidate_indices)
+        self.indices = None
+        self.indices_for = None
+
+
+    '''
+    Copies share the answer list (and the pattern rows made for it) instead of copying every word.
+    '''
+    def __deepcopy__(self, memo):
+        memo[id(self.answers)] = self.answers
+        new = object.__new__(type(self))
+        memo[id(self)] = new
+        for key, value in self.__dict__.items():
+            setattr(new, key, copy.deepcopy(value, memo))
 
+        return new
 
     '''
     Checks if the input word is possible given the information contained in self.
@@ -156,7 +181,10 @@ class Wordle_Information:
                     # NOTE: revisit this potentially. I'm almost positive that there's no way there could be
                     # significant conflicts or places where this marks words as valid that actually aren't,
                     # at least with 5-letter words
-                    if self.green[j] == None and j not in self.yellow[word[i]]:
+                    #
+                    # a green spot with the same letter counts too: guessing "agent" when the word is "galls" marks the
+                    # first a yellow because of the green a, not because there's another a somewhere
+                    if self.green[j] in (None, word[i]) and j not in self.yellow[word[i]]:
                         location_possible = True
                         break
                 
@@ -177,14 +205,21 @@ class Wordle_Information:
 
     '''
     Removes all words from word_list that are not possible given the current information.
+    Their indices in answers (see candidate_indices) are filtered along with them if they're already known.
     '''
     def update_word_list(self):
-        valid_words = []
-        for word in self.word_list:
-            if self.valid_word(word):
-                valid_words.append(word)
-        
-        self.word_list = valid_words
+        if self.word_list is self.answers:
+            known = range(len(self.answers))
+        elif self.indices_for is self.word_list:
+            known = self.indices
+        else:
+            known = None
+
+        valid = [self.valid_word(word) for word in self.word_list]
+        self.word_list = list(compress(self.word_list, valid))
+        if known is not None:
+            self.indices = list(compress(known, valid))
+            self.indices_for = self.word_list
     
     '''
     Reverse the effects of previous temporary call of add_info using the information stored in temp_changes.
@@ -383,6 +418,48 @@ class Wordle_Information:
         
         return True
     
+    '''
+    Indices of the possible words in answers. Kept up to date by update_word_list, so they only have to be looked up
+    word by word if word_list was set some other way.
+    '''
+    def candidate_indices(self):
+        if self.indices_for is not self.word_list:
+            if self.word_list is self.answers:
+                self.indices = list(range(len(self.answers)))
+            else:
+                self.indices = [self.answers.index(word) for word in self.word_list]
+            self.indices_for = self.word_list
+
+        return self.indices
+
+    '''
+    The pattern rows (see patterns.py) if they were made for the same answer list, otherwise None.
+    '''
+    def pattern_rows(self):
+        rows = get_pattern_rows()
+        return rows if rows.answers is self.answers else None
+
+    '''
+    Sort the possible words into buckets by the result guessing word would give if each of them were the answer.
+    Much cheaper than trying every result configuration like get_total_info does.
+    Results are read from the pattern rows (see pattern_rows) when word is in their guess list.
+
+    return: dict - keys are results (5-integer tuples with 0, 1, or 2), values are how many possible words give that result
+    '''
+    def get_result_buckets(self, word):
+        rows = self.pattern_rows()
+        guess_idx = guess_index(rows, word)
+        if guess_idx is not None:
+            codes = row_counts(rows.row(guess_idx), self.candidate_indices())
+            return {decode_result(code): count for code, count in codes.items()}
+
+        buckets = {}
+        for answer in self.word_list:
+            result = Wordle_Game(answer).make_guess(word).info
+            buckets[result] = buckets.get(result, 0) + 1
+
+        return buckets
+
     def get_possible_words(self):
         return self.word_list
     
@@ -419,7 +496,6 @@ class Wordle_Information:
 
     def get_total_info(self, word, progress_bar: tqdm=None):
         total_info = 0
-        random.shuffle(result_configs())
 
         for config in self.result_configs:
             if progress_bar:
@@ -441,4 +517,15 @@ class Wordle_Information:
         ret += "Gray: " + str(self.gray) + "\n"
         ret += "Possible words: " + str(self.count_possible_words()) + "\n"
         ret += "Words in word list: " + str(len(self.word_list)) + "\n"
-        return ret
\ No newline at end of file
+        return ret
+
+'''
+Wordle_Information after playing guesses against answer, for setting up positions partway through a game.
+'''
+def position_info(answer: str, guesses: List[str]) -> Wordle_Information:
+    info = Wordle_Information()
+    game = Wordle_Game(answer)
+    for guess in guesses:
+        info.add_info(game.make_guess(guess))
+
+    return info